@@ -832,8 +832,9 @@ async def receive_tradingview_webhook(
         )
     
     # 4. Execute orders on Bybit (ONLY for non-baseline trades in Phase II/III)
-    from app.services.order_executor import OrderExecutor
+    from app.services.order_executor import execute_live_trades
 
+    strategy_trades = []
     for trade in created_trades:
         # NEVER execute baseline trades (they collect data via timeout only)
         if trade.risk_strategy == 'baseline':
@@ -841,33 +842,8 @@ async def receive_tradingview_webhook(
                 f"📊 Baseline trade {trade.id} created (NO orders placed - "
                 f"will collect data via 24h timeout)"
             )
-            continue
-
-        # Execute strategy trades in Phase II (demo testing) and Phase III (demo/live)
-        if current_phase in ['II', 'III']:
-            try:
-                executor = OrderExecutor()
-                # Force demo mode in Phase II, respect config in Phase III
-                force_demo = (current_phase == 'II') or (not PhaseConfig.ENABLE_LIVE_TRADING)
-                success = await executor.execute_trade(trade, db, force_demo=force_demo)
-                await executor.close()
-
-                if success:
-                    mode = "DEMO" if force_demo else "LIVE"
-                    logger.info(
-                        f"✅ Phase {current_phase} ({mode}): Bybit orders placed for "
-                        f"trade {trade.id} (Strategy: {trade.risk_strategy})"
-                    )
-                else:
-                    logger.warning(
-                        f"⚠️ Phase {current_phase}: Bybit order placement skipped/failed "
-                        f"for trade {trade.id}"
-                    )
-            except Exception as e:
-                logger.error(
-                    f"❌ Phase {current_phase}: Error placing Bybit orders for "
-                    f"trade {trade.id}: {e}"
-                )
+        elif current_phase in ['II', 'III']:
+            strategy_trades.append(trade)
         else:
             # Phase I strategy trades: Paper trading only (shouldn't happen, but handle gracefully)
             logger.info(
@@ -875,6 +851,29 @@ async def receive_tradingview_webhook(
                 f"(paper trading only, NO Bybit orders)"
             )
 
+    # Execute strategy trades in Phase II (demo testing) and Phase III (demo/live).
+    # Trades are committed above, so each runs on its own pooled session
+    # while the shared executor keeps the exchange session warm
+    if strategy_trades:
+        # Force demo mode in Phase II, respect config in Phase III
+        force_demo = (current_phase == 'II') or (not PhaseConfig.ENABLE_LIVE_TRADING)
+        results = await execute_live_trades(
+            [trade.id for trade in strategy_trades], force_demo=force_demo
+        )
+
+        mode = "DEMO" if force_demo else "LIVE"
+        for trade, success in zip(strategy_trades, results):
+            if success:
+                logger.info(
+                    f"✅ Phase {current_phase} ({mode}): Bybit orders placed for "
+                    f"trade {trade.id} (Strategy: {trade.risk_strategy})"
+                )
+            else:
+                logger.warning(
+                    f"⚠️ Phase {current_phase}: Bybit order placement skipped/failed "
+                    f"for trade {trade.id}"
+                )
+
     # 5. Start real-time price tracking (WebSocket) for the trade
     if price_tracker:
         for trade in created_trades:
@@ -3,7 +3,8 @@ Strategy Management API Routes
 
 Endpoints for viewing and managing the 3-phase strategy system
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, tuple_, func, desc
 from app.database.database import get_db
@@ -688,13 +689,14 @@ async def get_tp_sl_hit_rates(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/portfolio-simulation")
+@router.get("/portfolio-simulation", response_class=ORJSONResponse)
 async def get_portfolio_simulation(
     symbol: Optional[str] = None,
     direction: Optional[str] = None,
     webhook_source: Optional[str] = None,
     starting_capital: float = 100000.0,
     risk_pct: float = 0.1,
+    curve_resolution: int = Query(500, ge=0),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -715,6 +717,8 @@ async def get_portfolio_simulation(
     - webhook_source (optional): Filter by webhook source
     - starting_capital (optional): Starting balance in USD (default: 100000)
     - risk_pct (optional): % of balance to risk per trade (default: 0.1)
+    - curve_resolution (optional): Max balance curve points per strategy, evenly
+      spaced over the trades (default: 500, 0 = every trade)
     
     **Returns:**
     For each strategy:
@@ -722,7 +726,9 @@ async def get_portfolio_simulation(
     - Max balance & max drawdown %
     - Win rate, wins/losses, total trades
     - Win/loss streaks
-    - Balance curve (chronological balance snapshots)
+    - Balance curve (chronological balance snapshots), columnar: parallel
+      lists `trade`, `balance`, `balance_pct`, `pnl_usd`, `pnl_pct`, where
+      index 0 is the starting point (pnl 0). Zip the lists for per-trade rows.
     
     **Example:**
     ```
@@ -744,10 +750,12 @@ async def get_portfolio_simulation(
             direction=direction,
             webhook_source=webhook_source,
             starting_capital=starting_capital,
-            risk_pct=risk_pct
+            risk_pct=risk_pct,
+            curve_resolution=curve_resolution
         )
-        
-        return simulation
+
+        # Plain floats/lists only - rendered by orjson without jsonable_encoder
+        return ORJSONResponse(simulation)
         
     except Exception as e:
         logger.error(f"Error simulating portfolio performance: {e}", exc_info=True)
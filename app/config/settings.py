@@ -55,6 +55,7 @@ class Settings(BaseSettings):
     BYBIT_API_SECRET: str = Field("", env="BYBIT_API_SECRET")
     BYBIT_TESTNET: bool = Field(True, env="BYBIT_TESTNET")
     BYBIT_RECV_WINDOW: int = Field(5000, env="BYBIT_RECV_WINDOW")
+    BYBIT_USE_WS_TRADE_API: bool = Field(False, env="BYBIT_USE_WS_TRADE_API")  # Place/cancel orders over WebSocket
 
     # Trading Settings
     DEFAULT_SYMBOL: str = Field("BTCUSDT", env="DEFAULT_SYMBOL")
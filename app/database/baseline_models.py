@@ -55,6 +55,13 @@ class BaselineTrade(Base):
     __table_args__ = (
         Index('idx_baseline_active', 'status', 'symbol', 'webhook_source'),
         Index('idx_baseline_entry_time', 'entry_timestamp'),
+        # Phase decisions: completed trades per signal, newest first (backward
+        # scan serves ORDER BY exit_timestamp DESC); pnl included for index-only scans
+        Index(
+            'idx_baseline_hotpath',
+            'symbol', 'direction', 'webhook_source', 'status', 'exit_timestamp',
+            postgresql_include=['final_pnl_pct']
+        ),
         # Unique constraint already created in raw SQL with WHERE clause
         # SQLAlchemy ORM doesn't need to recreate partial indexes
     )
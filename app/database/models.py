@@ -4,8 +4,9 @@ Database Models for Andre Assassin
 Statistical trade tracking system with per-asset learning.
 TP levels are LEARNED from historical data, not hardcoded.
 """
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, Text, JSON, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, Text, JSON, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -66,6 +67,13 @@ class TradeSetup(Base):
         Index('idx_symbol_status_source', 'symbol', 'status', 'webhook_source'),
         Index('idx_status_timestamp', 'status', 'entry_timestamp'),
         Index('idx_symbol_direction_source', 'symbol', 'direction', 'webhook_source'),
+        # Completed trades in completion order (portfolio simulation); partial, so
+        # only the completed rows are indexed
+        Index(
+            'idx_completed_at_completed',
+            'completed_at',
+            postgresql_where=text("status = 'completed'")
+        ),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -203,10 +211,22 @@ class TradeSetup(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     notes = Column(Text, nullable=True)
+
+    # Exchange order IDs placed by OrderExecutor (entry, TPs, SL, trailing)
+    order_tracking = Column(JSON, nullable=True)
     
     # Relationships
     milestones = relationship("TradeMilestones", back_populates="trade_setup", uselist=False)
 
+    @hybrid_property
+    def effective_symbol(self):
+        """Symbol to trade on the exchange: CCXT format when known, else the original"""
+        return self.ccxt_symbol or self.symbol
+
+    @effective_symbol.expression
+    def effective_symbol(cls):
+        return func.coalesce(cls.ccxt_symbol, cls.symbol)
+
     def __repr__(self):
         return f"<TradeSetup {self.symbol} {self.direction} @ {self.entry_price} [{self.status}]>"
 
@@ -225,7 +245,7 @@ class TradePriceSample(Base):
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    trade_setup_id = Column(Integer, nullable=False, index=True)
+    trade_setup_id = Column(Integer, ForeignKey('trade_setups.id', ondelete='CASCADE'), nullable=False, index=True)
 
     timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
     price = Column(Numeric(20, 8), nullable=False)
@@ -3,7 +3,7 @@ Strategy Simulation and Performance Models
 
 Tracks Phase II strategy testing and Phase III live trading performance.
 """
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, ForeignKey, JSON, Index
 from sqlalchemy.sql import func
 from app.database.models import Base
 
@@ -16,6 +16,20 @@ class StrategySimulation(Base):
     Phase III: Other 3 strategies continue simulating while 1 is live
     """
     __tablename__ = "strategy_simulations"
+    __table_args__ = (
+        # Recent simulations per strategy (actual RR check); covers the join key and pnl
+        Index(
+            'idx_strategy_sim_hotpath',
+            'strategy_name', 'created_at',
+            postgresql_include=['trade_setup_id', 'simulated_pnl_pct']
+        ),
+        # Simulations joined per trade and grouped by strategy (portfolio simulation)
+        Index(
+            'idx_strategy_sim_trade_strategy',
+            'trade_setup_id', 'strategy_name',
+            postgresql_include=['simulated_pnl_pct']
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     trade_setup_id = Column(Integer, ForeignKey('trade_setups.id', ondelete='CASCADE'), nullable=False, index=True)
@@ -72,6 +86,7 @@ class StrategyPerformance(Base):
     max_duration_hours = Column(Numeric(10, 2))
     total_simulated_pnl = Column(Numeric(10, 2))  # Sum of last 10 trades
     strategy_score = Column(Numeric(10, 4))  # Composite score for ranking
+    actual_rr_20 = Column(Numeric(10, 4))  # Realized RR over last 20 simulations (0 = not verifiable)
 
     # Phase III eligibility flags
     meets_rr_requirement = Column(Boolean, default=False)  # RR >= 1.0
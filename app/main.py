@@ -17,6 +17,7 @@ from app.config import settings
 from app.services.price_tracker import PriceTracker
 from app.services.statistics_engine import StatisticsEngine
 from app.services.bybit_client import BybitClient
+from app.services.order_executor import OrderExecutor, get_order_executor, close_order_executor
 from app.services.market_data_service import MarketDataService
 from app.services.signal_generator import SignalGenerator
 from app.services.phase_manager import PhaseManager
@@ -42,13 +43,15 @@ market_data_service: Optional[MarketDataService] = None
 signal_generator: Optional[SignalGenerator] = None
 phase_manager: Optional[PhaseManager] = None
 ws_manager: Optional[WebSocketManager] = None
+order_executor: Optional[OrderExecutor] = None
+warmup_task: Optional[asyncio.Task] = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan - initialize services on startup"""
     global price_tracker, statistics_engine, db_manager, bybit_client, market_data_service
-    global signal_generator, phase_manager, ws_manager
+    global signal_generator, phase_manager, ws_manager, order_executor, warmup_task
 
     # ==================== STARTUP ====================
     logger.info("🚀 Andre Assassin High-WR Trading System starting up...")
@@ -71,6 +74,13 @@ async def lifespan(app: FastAPI):
         testnet=getattr(settings, 'BYBIT_TESTNET', True)
     )
 
+    # Warm up order execution so the first trade doesn't pay the connect/auth handshake
+    if getattr(settings, 'BYBIT_API_KEY', ''):
+        logger.info("🔥 Warming up OrderExecutor...")
+        order_executor = get_order_executor()
+        # Reference kept so the task isn't garbage-collected and can be stopped on shutdown
+        warmup_task = asyncio.create_task(order_executor.warmup())
+
     # Initialize services
     logger.info("📡 Initializing PriceTracker...")
     price_tracker = PriceTracker()
@@ -97,6 +107,7 @@ async def lifespan(app: FastAPI):
     app.state.signal_generator = signal_generator
     app.state.phase_manager = phase_manager
     app.state.ws_manager = ws_manager
+    app.state.order_executor = order_executor
     app.state.price_tracker = price_tracker
     app.state.statistics_engine = statistics_engine
 
@@ -128,6 +139,9 @@ async def lifespan(app: FastAPI):
 
             # Mark price tracker as running
             price_tracker.running = True
+
+            # Samples and trade updates are written by the group committer
+            price_tracker.start_committer()
             logger.info(f"✅ Price tracker active: {len(price_tracker.active_trades)} trades, {len(price_tracker.subscriptions)} symbols")
 
     # Run in background task
@@ -151,6 +165,9 @@ async def lifespan(app: FastAPI):
         logger.info("📡 Stopping WebSocket tracking...")
         price_tracker.running = False
 
+        # Wait for the group committer before the final commit and DB teardown
+        await price_tracker.stop_committer()
+
         # Force commit any pending batches
         async with AsyncSessionLocal() as db:
             await price_tracker._force_commit_batch(db)
@@ -163,6 +180,14 @@ async def lifespan(app: FastAPI):
     if ws_manager:
         await ws_manager.disconnect_all()
 
+    # Warmup may still be connecting - stop it before the executor's client closes
+    if warmup_task:
+        warmup_task.cancel()
+        await asyncio.gather(warmup_task, return_exceptions=True)
+    await close_order_executor()
+    if bybit_client:
+        await bybit_client.close()
+
     logger.info("✅ Andre Assassin High-WR Trading System shut down successfully")
 
 
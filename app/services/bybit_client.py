@@ -6,6 +6,7 @@ Integrates with the high-WR trading system for signal validation.
 """
 
 import ccxt.async_support as ccxt
+import ccxt.pro as ccxtpro
 import asyncio
 from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime, timedelta
@@ -39,7 +40,7 @@ class BybitClient:
     BASE_RETRY_DELAY = 1.0  # seconds
 
     def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None, testnet: bool = True,
-                 demo_trading: bool = False, max_connections: int = 10):
+                 demo_trading: bool = False, max_connections: int = 10, use_ws_trade_api: bool = False):
         """
         Initialize Bybit client with enhanced features.
 
@@ -49,26 +50,38 @@ class BybitClient:
             testnet: Use testnet environment (default: True)
             demo_trading: Use demo trading on live endpoint (default: False)
             max_connections: Maximum concurrent connections (default: 10)
+            use_ws_trade_api: Place/cancel orders over the private WebSocket trade
+                              channel instead of HTTP (default: False, not available
+                              for demo trading)
         """
+        # Shared keep-alive HTTP session so orders reuse warm TCP/TLS connections
+        # instead of handshaking per request
+        self.max_connections = max_connections
+        self._http_session = self._create_http_session()
+
         # Initialize exchange with connection limits
         self.exchange = ccxt.bybit({
             'apiKey': api_key,
             'secret': api_secret,
+            # CCXT's token-bucket limiter with Bybit's own per-endpoint costs
+            # (rateLimit defaults to 20ms per cost unit, e.g. order create = 2.5
+            # -> 20 orders/s). Capacity lets a trade's exit orders go out as one
+            # burst instead of being spaced out one by one.
             'enableRateLimit': True,
-            'rateLimit': 100,  # milliseconds between requests
+            'tokenBucket': {
+                'capacity': 10,
+            },
             'options': {
                 'defaultType': 'linear',  # USDT perpetual
                 'testnet': testnet if not demo_trading else False,  # Demo uses live endpoint
                 'adjustForTimeDifference': True,  # Auto-adjust for time sync issues
             },
-            # Connection pool settings
-            'aiohttp': {
-                'connector': aiohttp.TCPConnector(
-                    limit=max_connections,
-                    limit_per_host=max_connections,
-                    ttl_dns_cache=300
-                )
-            }
+            # Connection pool settings (CCXT uses a provided session as-is)
+            'session': self._http_session,
+            'headers': {
+                'Connection': 'keep-alive',
+                'Keep-Alive': 'timeout=75, max=1000',
+            },
         })
 
         # Enable demo trading if requested (must be after initialization)
@@ -76,6 +89,24 @@ class BybitClient:
             self.exchange.enable_demo_trading(True)
             logger.info("🎮 Demo trading enabled (using live API with virtual funds)")
 
+        # Persistent WebSocket trade session (orders only, HTTP stays for everything else)
+        self.ws_exchange: Optional[ccxtpro.bybit] = None
+        if use_ws_trade_api and api_key and not demo_trading:
+            self.ws_exchange = ccxtpro.bybit({
+                'apiKey': api_key,
+                'secret': api_secret,
+                'options': {
+                    'defaultType': 'linear',
+                    'testnet': testnet,
+                },
+            })
+            if testnet:
+                self.ws_exchange.set_sandbox_mode(True)
+            logger.info("⚡ WebSocket trade API enabled for order placement")
+
+        # Close of a disabled WS trade session (awaited by close())
+        self._ws_close_task: Optional[asyncio.Task] = None
+
         self.is_connected = False
         self.testnet = testnet
         self.demo_trading = demo_trading
@@ -101,6 +132,19 @@ class BybitClient:
         self.total_requests = 0
         self.failed_requests = 0
 
+    def _create_http_session(self) -> aiohttp.ClientSession:
+        """Create the pooled keep-alive HTTP session used by the exchange."""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections,
+                keepalive_timeout=75,
+                force_close=False,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+        )
+
     async def connect(self) -> bool:
         """
         Test connection to Bybit and load markets.
@@ -109,6 +153,11 @@ class BybitClient:
             True if connection successful
         """
         try:
+            # Reopen the pooled session if the client was closed earlier
+            if self._http_session.closed:
+                self._http_session = self._create_http_session()
+                self.exchange.session = self._http_session
+
             await self._execute_with_retry(self.exchange.load_markets)
             self.is_connected = True
             await self._update_health_status(True)
@@ -121,9 +170,42 @@ class BybitClient:
             return False
 
     async def close(self):
-        """Close exchange connection."""
-        await self.exchange.close()
-        self.is_connected = False
+        """Close exchange connection (every session is closed even if one fails)."""
+        try:
+            try:
+                await self.exchange.close()
+            finally:
+                # CCXT doesn't close sessions it didn't create
+                await self._http_session.close()
+        finally:
+            try:
+                if self.ws_exchange is not None:
+                    await self.ws_exchange.close()
+            finally:
+                if self._ws_close_task is not None:
+                    await self._ws_close_task
+                    self._ws_close_task = None
+                self.is_connected = False
+
+    def disable_ws_trade_api(self, reason: str):
+        """
+        Drop back to HTTP order placement after a WebSocket trade failure.
+
+        The WS session is closed in the background (callers are in an order's
+        error path); the task is kept so close() can await it.
+        """
+        if self.ws_exchange is not None:
+            logger.warning(f"⚠️ Disabling WebSocket trade API, using HTTP: {reason}")
+            ws_exchange, self.ws_exchange = self.ws_exchange, None
+            self._ws_close_task = asyncio.create_task(self._close_ws_exchange(ws_exchange))
+
+    @staticmethod
+    async def _close_ws_exchange(ws_exchange: "ccxtpro.bybit"):
+        """Close a disabled WS trade session, logging (not raising) failures."""
+        try:
+            await ws_exchange.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to close WebSocket trade session: {e}")
 
     async def _execute_with_retry(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -377,6 +459,8 @@ class BybitClient:
                     'price': market['precision']['price'],
                     'amount': market['precision']['amount'],
                 },
+                # Tells consumers whether precision values are tick sizes or decimal places
+                'precision_mode': self.exchange.precisionMode,
                 'limits': {
                     'amount': {
                         'min': market['limits']['amount']['min'],
@@ -815,7 +899,8 @@ _bybit_pool: Optional[BybitConnectionPool] = None
 
 async def get_bybit_client(use_pool: bool = False, pool_size: int = 5,
                            api_key: Optional[str] = None, api_secret: Optional[str] = None,
-                           testnet: bool = False, demo_trading: bool = True) -> BybitClient:
+                           testnet: bool = False, demo_trading: bool = True,
+                           use_ws_trade_api: bool = False) -> BybitClient:
     """
     Get or create global Bybit client instance.
 
@@ -826,6 +911,7 @@ async def get_bybit_client(use_pool: bool = False, pool_size: int = 5,
         api_secret: Bybit API secret (from env if None)
         testnet: Use testnet (default: False)
         demo_trading: Use demo trading on live endpoint (default: True)
+        use_ws_trade_api: Route orders over the WebSocket trade API (default: False)
 
     Returns:
         BybitClient instance
@@ -855,7 +941,8 @@ async def get_bybit_client(use_pool: bool = False, pool_size: int = 5,
                 api_secret=api_secret,
                 testnet=testnet,
                 demo_trading=demo_trading,
-                max_connections=10
+                max_connections=10,
+                use_ws_trade_api=use_ws_trade_api
             )
             await _bybit_client.connect()
         return _bybit_client
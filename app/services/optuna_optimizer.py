@@ -724,6 +724,45 @@ class OptunaOptimizer:
 
         Uses same scoring as PhaseConfig but optimized for Optuna.
         """
+        return self._score_with_penalty(
+            win_rate,
+            rr_ratio,
+            expected_value,
+            self._duration_penalty(avg_duration_hours)
+        )
+
+    def _specialize_score(self, avg_duration_hours: float):
+        """
+        Build a scorer with the duration penalty folded in.
+
+        Used where the duration is fixed for every call (e.g. the 24h default
+        when scoring Pareto picks), so the penalty is computed once.
+        """
+        duration_penalty = self._duration_penalty(avg_duration_hours)
+
+        def score(win_rate: float, rr_ratio: float, expected_value: float) -> float:
+            return self._score_with_penalty(win_rate, rr_ratio, expected_value, duration_penalty)
+
+        return score
+
+    def _duration_penalty(self, avg_duration_hours: float) -> float:
+        """Duration penalty (capital efficiency)"""
+        if avg_duration_hours > self.config.DURATION_PENALTY_THRESHOLD_HOURS:
+            excess_hours = avg_duration_hours - self.config.DURATION_PENALTY_THRESHOLD_HOURS
+            return min(
+                excess_hours / self.config.DURATION_PENALTY_SCALE_HOURS * 20,
+                20
+            )
+        return 0
+
+    def _score_with_penalty(
+        self,
+        win_rate: float,
+        rr_ratio: float,
+        expected_value: float,
+        duration_penalty: float
+    ) -> float:
+        """Combine WR, R/R and EV components and subtract a precomputed duration penalty."""
         if self.optimize_for_win_rate:
             # High-WR mode: Prioritize win rate
             wr_score = (win_rate / 100) ** self.config.SCORE_WIN_RATE_EXPONENT * 70
@@ -740,15 +779,6 @@ class OptunaOptimizer:
             wr_score = (win_rate / 100) * 60
             rr_score = min(rr_ratio, 3.0) / 3.0 * 40
 
-        # Duration penalty (capital efficiency)
-        duration_penalty = 0
-        if avg_duration_hours > self.config.DURATION_PENALTY_THRESHOLD_HOURS:
-            excess_hours = avg_duration_hours - self.config.DURATION_PENALTY_THRESHOLD_HOURS
-            duration_penalty = min(
-                excess_hours / self.config.DURATION_PENALTY_SCALE_HOURS * 20,
-                20
-            )
-
         # Expected value bonus
         ev_bonus = max(0, expected_value * 10)
 
@@ -1389,6 +1419,9 @@ def _select_diverse_strategies_from_pareto(
     strategies = []
     selected_indices = set()
 
+    # Pareto picks don't carry a duration, so score them at the 24h default
+    score_dur24 = optimizer._specialize_score(avg_duration_hours=24)
+
     # 1. Add strategy with highest win rate
     if 'win_rate' in result.best_by_objective:
         best_wr = result.best_by_objective['win_rate']
@@ -1403,11 +1436,10 @@ def _select_diverse_strategies_from_pareto(
             'win_rate': best_wr['all_objectives']['win_rate'],
             'rr_ratio': best_wr['all_objectives']['rr_ratio'],
             'expected_value': best_wr['all_objectives']['expected_value'],
-            'quality_score': optimizer._calculate_score(
-                win_rate=best_wr['all_objectives']['win_rate'],
-                rr_ratio=best_wr['all_objectives']['rr_ratio'],
-                expected_value=best_wr['all_objectives']['expected_value'],
-                avg_duration_hours=24
+            'quality_score': score_dur24(
+                best_wr['all_objectives']['win_rate'],
+                best_wr['all_objectives']['rr_ratio'],
+                best_wr['all_objectives']['expected_value']
             ),
             'optimization_method': 'optuna_multi_wr',
             'strategy_profile': 'high_win_rate'
@@ -1427,11 +1459,10 @@ def _select_diverse_strategies_from_pareto(
             'win_rate': best_rr['all_objectives']['win_rate'],
             'rr_ratio': best_rr['all_objectives']['rr_ratio'],
             'expected_value': best_rr['all_objectives']['expected_value'],
-            'quality_score': optimizer._calculate_score(
-                win_rate=best_rr['all_objectives']['win_rate'],
-                rr_ratio=best_rr['all_objectives']['rr_ratio'],
-                expected_value=best_rr['all_objectives']['expected_value'],
-                avg_duration_hours=24
+            'quality_score': score_dur24(
+                best_rr['all_objectives']['win_rate'],
+                best_rr['all_objectives']['rr_ratio'],
+                best_rr['all_objectives']['expected_value']
             ),
             'optimization_method': 'optuna_multi_rr',
             'strategy_profile': 'high_risk_reward'
@@ -1451,11 +1482,10 @@ def _select_diverse_strategies_from_pareto(
             'win_rate': best_ev['all_objectives']['win_rate'],
             'rr_ratio': best_ev['all_objectives']['rr_ratio'],
             'expected_value': best_ev['all_objectives']['expected_value'],
-            'quality_score': optimizer._calculate_score(
-                win_rate=best_ev['all_objectives']['win_rate'],
-                rr_ratio=best_ev['all_objectives']['rr_ratio'],
-                expected_value=best_ev['all_objectives']['expected_value'],
-                avg_duration_hours=24
+            'quality_score': score_dur24(
+                best_ev['all_objectives']['win_rate'],
+                best_ev['all_objectives']['rr_ratio'],
+                best_ev['all_objectives']['expected_value']
             ),
             'optimization_method': 'optuna_multi_ev',
             'strategy_profile': 'highest_expected_value'
@@ -1512,6 +1542,19 @@ def _select_diverse_strategies_from_pareto(
     return strategies[:4]  # Ensure we return exactly 4
 
 
+def _find_pareto_index(best: Dict, pareto_front: List[Dict]) -> Optional[int]:
+    """
+    Locate a best_by_objective entry in the Pareto front.
+
+    best_by_objective entries are built from Pareto front trials, so matching
+    params and objectives identifies the trial. Returns None if not found.
+    """
+    for idx, trial in enumerate(pareto_front):
+        if trial['params'] == best['params'] and trial['objectives'] == best['all_objectives']:
+            return idx
+    return None
+
+
 async def _save_optimization_results(db, symbol: str, direction: str, result: OptimizationResult):
     """
     Save Optuna optimization results to database for analysis.
@@ -1548,7 +1591,11 @@ async def _save_optimization_results(db, symbol: str, direction: str, result: Op
                 'best_rr_ratio': result.best_by_objective.get('rr_ratio', {}).get('value', 0),
                 'best_expected_value': result.best_by_objective.get('expected_value', {}).get('value', 0),
                 'pareto_front': result.pareto_front,  # Store as JSON
-                'best_by_objective': result.best_by_objective  # Store as JSON
+                # Indices into pareto_front so the same trials aren't serialized twice
+                'best_by_objective_idx': {
+                    obj_name: _find_pareto_index(best, result.pareto_front)
+                    for obj_name, best in result.best_by_objective.items()
+                }
             })
         else:
             # Single-objective data
@@ -1566,11 +1613,15 @@ async def _save_optimization_results(db, symbol: str, direction: str, result: Op
 
         # If using PostgreSQL persistence, log the connection info
         if result.storage_url:
-            logger.info(f"Study persisted to database. Resume with:")
-            logger.info(f"  study = optuna.load_study(")
-            logger.info(f"    study_name='{result.study_name}',")
-            logger.info(f"    storage='{result.storage_url}'")
-            logger.info(f"  )")
+            logger.info(
+                "Study persisted to database. Resume with:\n"
+                "  study = optuna.load_study(\n"
+                "    study_name=%r,\n"
+                "    storage=%r\n"
+                "  )",
+                result.study_name,
+                result.storage_url
+            )
 
     except Exception as e:
         logger.error(f"Failed to save optimization results: {e}")
@@ -13,21 +13,38 @@ and real money trading (Phase III) with comprehensive safety controls.
 """
 
 import logging
-from datetime import datetime
+import math
+import time
+from collections import OrderedDict
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any, Tuple
 import asyncio
 
+import ccxt.async_support as ccxt
+import orjson
+from ccxt.base.decimal_to_precision import TICK_SIZE
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, select, update
 
+from app.database.database import AsyncSessionLocal
 from app.database.models import TradeSetup
 from app.config.settings import settings
 from app.config.phase_config import PhaseConfig
 from app.services.bybit_client import get_bybit_client, BybitClient
+from app.utils.retry import db_retry
 
 logger = logging.getLogger(__name__)
 
+# sync_position result when there is no (readable) position - copied per call
+_EMPTY_POSITION = MappingProxyType({
+    'position_size': 0,
+    'entry_price': 0,
+    'unrealized_pnl': 0,
+    'side': 'none',
+    'synced': False
+})
+
 
 class OrderExecutionError(Exception):
     """Raised when order execution fails"""
@@ -54,6 +71,13 @@ class OrderExecutor:
     - Logs every action for audit trail
     """
 
+    # Market precision/limits change rarely - cache per symbol across executors
+    _market_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+    _MARKET_TTL = 3600  # seconds
+
+    # Bybit cancel-batch accepts at most 10 linear orders per request
+    _CANCEL_BATCH_LIMIT = 10
+
     def __init__(self, bybit_client: Optional[BybitClient] = None):
         """
         Initialize OrderExecutor.
@@ -64,6 +88,7 @@ class OrderExecutor:
         """
         self.client = bybit_client
         self._client_owned = bybit_client is None  # Track if we need to manage client lifecycle
+        self._warmed = False
 
     async def _ensure_client(self) -> BybitClient:
         """
@@ -75,6 +100,10 @@ class OrderExecutor:
         Raises:
             OrderExecutionError: If client connection fails
         """
+        # Fast path: already connected
+        if self.client is not None and self.client.is_connected:
+            return self.client
+
         if self.client is None:
             try:
                 # Get client from settings (will use demo trading if configured)
@@ -82,7 +111,8 @@ class OrderExecutor:
                     api_key=settings.BYBIT_API_KEY,
                     api_secret=settings.BYBIT_API_SECRET,
                     testnet=settings.BYBIT_TESTNET,
-                    demo_trading=not PhaseConfig.ENABLE_LIVE_TRADING  # Use demo if live trading disabled
+                    demo_trading=not PhaseConfig.ENABLE_LIVE_TRADING,  # Use demo if live trading disabled
+                    use_ws_trade_api=settings.BYBIT_USE_WS_TRADE_API
                 )
                 logger.info(f"✅ Bybit client initialized (demo_trading={not PhaseConfig.ENABLE_LIVE_TRADING})")
             except Exception as e:
@@ -98,6 +128,64 @@ class OrderExecutor:
 
         return self.client
 
+    async def warmup(self) -> bool:
+        """
+        Open and authenticate exchange connections ahead of the first order.
+
+        Connecting loads markets once, and a signed balance request completes
+        the TLS + auth handshake, so the first execute_trade doesn't pay for it.
+        Safe to call repeatedly; later calls are no-ops.
+
+        Returns:
+            True if the client is warm
+        """
+        if self._warmed:
+            return True
+
+        try:
+            client = await self._ensure_client()
+            await client.exchange.fetch_balance()
+
+            if client.ws_exchange is not None:
+                if client.ws_exchange.has.get('fetchBalanceWs'):
+                    await client.ws_exchange.fetch_balance_ws()
+                else:
+                    await client.ws_exchange.load_markets()
+
+            self._warmed = True
+            logger.info("🔥 OrderExecutor warmed up (markets loaded, connection authenticated)")
+            return True
+
+        except Exception as e:
+            logger.warning(f"⚠️ OrderExecutor warmup failed (will connect on first trade): {e}")
+            return False
+
+    async def _create_order(self, client: BybitClient, **order) -> Dict[str, Any]:
+        """
+        Submit a single order, preferring the WebSocket trade API.
+
+        Falls back to HTTP when the WS trade session is not available. A WS
+        network failure is not retried over HTTP (the order may already have
+        been accepted); it disables WS for subsequent orders instead.
+        """
+        if client.ws_exchange is not None:
+            try:
+                return await client.ws_exchange.create_order_ws(**order)
+            except ccxt.NetworkError as e:
+                client.disable_ws_trade_api(str(e))
+                raise
+        return await client.exchange.create_order(**order)
+
+    async def _cancel_order(self, client: BybitClient, order_id: str, symbol: str) -> Dict[str, Any]:
+        """Cancel a single order, preferring the WebSocket trade API."""
+        if client.ws_exchange is not None:
+            try:
+                return await client.ws_exchange.cancel_order_ws(order_id, symbol)
+            except ccxt.NetworkError as e:
+                client.disable_ws_trade_api(str(e))
+                raise
+        return await client.exchange.cancel_order(order_id, symbol)
+
     async def execute_trade(self, trade: TradeSetup, db: AsyncSession, force_demo: bool = True) -> bool:
         """
         Execute complete trade lifecycle: entry, TPs, SL, and optional trailing stop.
@@ -106,7 +194,8 @@ class OrderExecutor:
 
         Args:
             trade: TradeSetup instance with all trade parameters
-            db: Database session for updating trade record
+            db: Database session for updating trade record (committed once the
+                order IDs are set; see _persist_order_tracking)
             force_demo: If True (default), always execute on demo even if ENABLE_LIVE_TRADING=False
 
         Returns:
@@ -127,15 +216,15 @@ class OrderExecutor:
 
             if not is_live_money and not is_demo:
                 logger.info(
-                    f"ℹ️ Trade {trade.id} ({trade.symbol}) skipped. "
-                    f"Set force_demo=True to execute on demo account."
+                    "ℹ️ Trade %s (%s) skipped. Set force_demo=True to execute on demo account.",
+                    trade.id, trade.symbol
                 )
                 return False
 
             execution_mode = "🔴 LIVE (REAL MONEY)" if is_live_money else "🟢 DEMO (VIRTUAL $99K)"
             logger.info(
-                f"🚀 {execution_mode} TRADE EXECUTION STARTED: {trade.symbol} {trade.direction} "
-                f"(Trade ID: {trade.id})"
+                "🚀 %s TRADE EXECUTION STARTED: %s %s (Trade ID: %s)",
+                execution_mode, trade.symbol, trade.direction, trade.id
             )
 
             # ========================================
@@ -145,33 +234,41 @@ class OrderExecutor:
                 logger.error(f"❌ Trade {trade.id} failed parameter validation")
                 return False
 
+            # Bind hot attributes once - avoids repeated ORM attribute access below
+            symbol = trade.effective_symbol
+            direction = trade.direction
+            entry_price = float(trade.entry_price)
+            trade_id = trade.id
+
             # ========================================
             # STEP 1: Initialize Bybit Client
             # ========================================
             client = await self._ensure_client()
 
             # ========================================
-            # STEP 2: Get Market Information
+            # STEP 2 + 2.5: Get Market Information and Set Leverage
             # ========================================
-            market_info = await self._get_market_info(trade.ccxt_symbol or trade.symbol)
-            if not market_info:
-                logger.error(f"❌ Could not fetch market info for {trade.symbol}")
-                return False
-
-            # ========================================
-            # STEP 2.5: Set Leverage
-            # ========================================
-            try:
-                leverage = int(trade.leverage) if trade.leverage else 5
-                await client.exchange.set_leverage(
+            # Independent requests - run them concurrently
+            leverage = int(trade.leverage) if trade.leverage else 5
+            market_info, leverage_result = await asyncio.gather(
+                self._get_market_info(symbol),
+                client.exchange.set_leverage(
                     leverage,
-                    trade.ccxt_symbol or trade.symbol,
+                    symbol,
                     params={'positionIdx': 0}  # One-way mode
-                )
-                logger.info(f"⚙️ Leverage set to {leverage}x for {trade.symbol}")
-            except Exception as e:
-                logger.warning(f"⚠️ Could not set leverage (may already be set): {e}")
+                ),
+                return_exceptions=True
+            )
+
+            if isinstance(leverage_result, Exception):
+                logger.warning(f"⚠️ Could not set leverage (may already be set): {leverage_result}")
                 # Don't fail - leverage might already be set correctly
+            else:
+                logger.info("⚙️ Leverage set to %sx for %s", leverage, trade.symbol)
+
+            if not market_info or isinstance(market_info, Exception):
+                logger.error(f"❌ Could not fetch market info for {trade.symbol}")
+                return False
 
             # ========================================
             # STEP 3: Calculate Position Size
@@ -179,66 +276,103 @@ class OrderExecutor:
             qty = await self._calculate_position_size(
                 trade=trade,
                 market_info=market_info,
-                entry_price=float(trade.entry_price)
+                entry_price=entry_price
             )
 
             if not qty or qty <= 0:
                 logger.error(f"❌ Invalid position size calculated: {qty}")
                 return False
 
-            logger.info(f"💼 Position size: {qty} contracts @ ${trade.entry_price}")
+            logger.info("💼 Position size: %s contracts @ $%s", qty, trade.entry_price)
 
             # ========================================
             # STEP 4: Place Entry Order (Market Order)
             # ========================================
             entry_order_id = await self.place_entry_order(
-                symbol=trade.ccxt_symbol or trade.symbol,
-                direction=trade.direction,
+                symbol=symbol,
+                direction=direction,
                 qty=qty,
-                market_info=market_info
+                market_info=market_info,
+                client=client
             )
 
             if not entry_order_id:
-                logger.error(f"❌ Failed to place entry order for trade {trade.id}")
+                logger.error(f"❌ Failed to place entry order for trade {trade_id}")
                 return False
 
-            logger.info(f"✅ Entry order placed: {entry_order_id}")
+            logger.info("✅ Entry order placed: %s", entry_order_id)
+
+            # Exits are reduce-only - they need the position to exist. Market
+            # entries are normally filled already (one check); otherwise wait on
+            # the fill up to a fixed deadline instead of sleeping blindly
+            if not await self.wait_for_fill(symbol, entry_order_id, timeout=2.0, client=client):
+                logger.warning(
+                    "⚠️ Entry order %s not confirmed filled within 2s, placing exit orders anyway",
+                    entry_order_id
+                )
 
             # ========================================
-            # STEP 5: Place Take-Profit Orders
+            # STEP 5 + 6: Place Take-Profit and Stop-Loss Orders
             # ========================================
-            tp_order_ids = await self.place_tp_orders(
-                symbol=trade.ccxt_symbol or trade.symbol,
-                direction=trade.direction,
+            tp1_pct = float(trade.planned_tp1_pct) if trade.planned_tp1_pct else None
+            tp2_pct = float(trade.planned_tp2_pct) if trade.planned_tp2_pct else None
+            tp3_pct = float(trade.planned_tp3_pct) if trade.planned_tp3_pct else None
+            sl_pct = float(trade.planned_sl_pct) if trade.planned_sl_pct else None
+
+            # Prefer a single batch request for all exit orders
+            batch_result = await self._place_exit_orders_batch(
+                symbol=symbol,
+                direction=direction,
                 qty=qty,
-                entry_price=float(trade.entry_price),
-                tp1_pct=float(trade.planned_tp1_pct) if trade.planned_tp1_pct else None,
-                tp2_pct=float(trade.planned_tp2_pct) if trade.planned_tp2_pct else None,
-                tp3_pct=float(trade.planned_tp3_pct) if trade.planned_tp3_pct else None,
-                market_info=market_info
+                entry_price=entry_price,
+                tp1_pct=tp1_pct,
+                tp2_pct=tp2_pct,
+                tp3_pct=tp3_pct,
+                sl_pct=sl_pct,
+                market_info=market_info,
+                trade_id=trade.id,
+                client=client
             )
 
-            logger.info(f"✅ TP orders placed: {tp_order_ids}")
+            if batch_result is not None:
+                tp_order_ids, sl_order_id = batch_result
+            else:
+                tp_order_ids = await self.place_tp_orders(
+                    symbol=symbol,
+                    direction=direction,
+                    qty=qty,
+                    entry_price=entry_price,
+                    tp1_pct=tp1_pct,
+                    tp2_pct=tp2_pct,
+                    tp3_pct=tp3_pct,
+                    market_info=market_info,
+                    client=client
+                )
+
+                sl_order_id = await self.place_sl_order(
+                    symbol=symbol,
+                    direction=direction,
+                    qty=qty,
+                    entry_price=entry_price,
+                    sl_pct=sl_pct,
+                    market_info=market_info,
+                    client=client
+                )
 
-            # ========================================
-            # STEP 6: Place Stop-Loss Order
-            # ========================================
-            sl_order_id = await self.place_sl_order(
-                symbol=trade.ccxt_symbol or trade.symbol,
-                direction=trade.direction,
-                qty=qty,
-                entry_price=float(trade.entry_price),
-                sl_pct=float(trade.planned_sl_pct) if trade.planned_sl_pct else None,
-                market_info=market_info
-            )
+            logger.info("✅ TP orders placed: %s", tp_order_ids)
 
             if not sl_order_id:
-                logger.error(f"❌ Failed to place SL order for trade {trade.id}")
-                # Try to cancel all orders and exit position
-                await self.cancel_orders(trade.ccxt_symbol or trade.symbol, entry_order_id, tp_order_ids)
+                logger.error(f"❌ Failed to place SL order for trade {trade_id}")
+                # Try to cancel all orders and exit position. TP submission has fully
+                # completed by now (gather/batch), so there are no in-flight requests
+                # to cancel - shield the rollback so cancelling execute_trade itself
+                # (e.g. shutdown) can't leave stray orders on the exchange.
+                await asyncio.shield(
+                    self.cancel_orders(symbol, entry_order_id, tp_order_ids, client=client)
+                )
                 return False
 
-            logger.info(f"✅ Stop-loss order placed: {sl_order_id}")
+            logger.info("✅ Stop-loss order placed: %s", sl_order_id)
 
             # ========================================
             # STEP 7: Setup Trailing Stop (if enabled)
@@ -246,17 +380,18 @@ class OrderExecutor:
             trailing_order_id = None
             if trade.use_trailing_stop:
                 trailing_order_id = await self.setup_trailing_stop(
-                    symbol=trade.ccxt_symbol or trade.symbol,
-                    direction=trade.direction,
+                    symbol=symbol,
+                    direction=direction,
                     qty=qty,
-                    entry_price=float(trade.entry_price),
+                    entry_price=entry_price,
                     activation_pct=float(trade.trailing_stop_activation_pct) if trade.trailing_stop_activation_pct else 2.0,
                     distance_pct=float(trade.trailing_stop_distance_pct) if trade.trailing_stop_distance_pct else 1.0,
-                    market_info=market_info
+                    market_info=market_info,
+                    client=client
                 )
 
                 if trailing_order_id:
-                    logger.info(f"✅ Trailing stop configured: {trailing_order_id}")
+                    logger.info("✅ Trailing stop configured: %s", trailing_order_id)
 
             # ========================================
             # STEP 8: Update Trade Record with Order IDs
@@ -266,27 +401,32 @@ class OrderExecutor:
                 'tp_order_ids': tp_order_ids,
                 'sl_order_id': sl_order_id,
                 'trailing_order_id': trailing_order_id,
-                'execution_timestamp': datetime.now().isoformat(),
+                'execution_timestamp_ns': time.time_ns(),  # Epoch ns; format at display time
                 'position_qty': qty
             }
 
-            # Store in trade.notes as JSON for now
-            # TODO: Add dedicated columns to TradeSetup model for order tracking
-            import json
+            trade.order_tracking = order_tracking
+
+            # Keep the legacy [ORDER_IDS] notes entry during rollout for readers
+            # that predate the order_tracking column
             current_notes = trade.notes or ""
-            order_info = f"\n\n[ORDER_IDS] {json.dumps(order_tracking)}"
+            order_info = f"\n\n[ORDER_IDS] {orjson.dumps(order_tracking).decode()}"
             trade.notes = current_notes + order_info
 
-            await db.commit()
-            await db.refresh(trade)
+            # Orders are already live on the exchange - the IDs must be stored
+            # before returning, or cancel/sync can't find them
+            await self._persist_order_tracking(trade, db, order_tracking)
 
-            logger.info(
-                f"🎉 LIVE TRADE EXECUTION COMPLETED: {trade.symbol} {trade.direction}\n"
-                f"   Entry Order: {entry_order_id}\n"
-                f"   TP Orders: {tp_order_ids}\n"
-                f"   SL Order: {sl_order_id}\n"
-                f"   Trailing: {trailing_order_id or 'N/A'}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "🎉 LIVE TRADE EXECUTION COMPLETED: %s %s\n"
+                    "   Entry Order: %s\n"
+                    "   TP Orders: %s\n"
+                    "   SL Order: %s\n"
+                    "   Trailing: %s",
+                    symbol, direction, entry_order_id, tp_order_ids,
+                    sl_order_id, trailing_order_id or 'N/A'
+                )
 
             return True
 
@@ -297,6 +437,54 @@ class OrderExecutor:
             )
             return False
 
+    async def _persist_order_tracking(
+        self,
+        trade: TradeSetup,
+        db: AsyncSession,
+        order_tracking: Dict[str, Any]
+    ):
+        """
+        Commit the order IDs already set on the trade.
+
+        Commits the caller's session (with whatever else it has pending). If
+        that fails, the IDs alone are written with a fresh session and retries;
+        if that fails too they are logged at CRITICAL so the live orders can
+        still be found.
+
+        The rollback expires the trade, so it is reloaded afterwards - callers
+        keep reading its attributes. If the IDs were not written they are set
+        on it again, for the caller's next commit to retry.
+        """
+        trade_id = trade.id
+        notes = trade.notes
+
+        try:
+            await db.commit()
+            return
+        except Exception as e:
+            logger.error(f"❌ Failed to commit order IDs for trade {trade_id}, retrying separately: {e}")
+            await db.rollback()
+
+        written = False
+        try:
+            await _write_order_tracking(trade_id, order_tracking, notes)
+            written = True
+        except Exception as e:
+            logger.critical(
+                f"🚨 Order IDs for trade {trade_id} NOT persisted - live orders are untracked: "
+                f"{orjson.dumps(order_tracking).decode()} ({e})"
+            )
+
+        try:
+            await db.refresh(trade)
+        except Exception as e:
+            logger.error(f"❌ Failed to reload trade {trade_id} after rollback: {e}")
+            return
+
+        if not written:
+            trade.order_tracking = order_tracking
+            trade.notes = notes
+
     def _validate_trade_parameters(self, trade: TradeSetup) -> bool:
         """
         Validate trade has all required parameters for execution.
@@ -307,17 +495,20 @@ class OrderExecutor:
         Returns:
             True if valid, False otherwise
         """
-        required_fields = {
-            'symbol': trade.symbol,
-            'direction': trade.direction,
-            'entry_price': trade.entry_price,
-            'planned_sl_pct': trade.planned_sl_pct,
-            'notional_position_usd': trade.notional_position_usd,
-        }
-
-        missing = [k for k, v in required_fields.items() if v is None]
-
-        if missing:
+        if (
+            trade.symbol is None
+            or trade.direction is None
+            or trade.entry_price is None
+            or trade.planned_sl_pct is None
+            or trade.notional_position_usd is None
+        ):
+            # Slow path only on failure: report which fields are missing
+            missing = [
+                field for field in (
+                    'symbol', 'direction', 'entry_price', 'planned_sl_pct', 'notional_position_usd'
+                )
+                if getattr(trade, field) is None
+            ]
             logger.error(f"❌ Missing required fields: {missing}")
             return False
 
@@ -343,14 +534,80 @@ class OrderExecutor:
         Returns:
             Market info dict with precision, limits, etc.
         """
+        cached = self._market_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < self._MARKET_TTL:
+            return cached[1]
+
         try:
             client = await self._ensure_client()
             market_info = await client.get_market_info(symbol)
+            if market_info:
+                self._market_cache[symbol] = (time.monotonic(), market_info)
             return market_info
         except Exception as e:
             logger.error(f"❌ Failed to get market info for {symbol}: {e}")
             return None
 
+    @staticmethod
+    def _precision_scale(precision: Any, precision_mode: Any) -> float:
+        """
+        Convert a CCXT precision value into steps per unit.
+
+        Bybit reports precision as a tick size (e.g. 0.001), other modes as
+        decimal places (e.g. 3) - both map to a scale of 1000.
+        """
+        if precision_mode == TICK_SIZE:
+            return 1 / float(precision)
+        return 10 ** int(precision)
+
+    @staticmethod
+    def _snap_to_tick(value: float, scale: float, down: bool) -> float:
+        """
+        Snap a value onto the exchange tick grid.
+
+        Exchanges expect values on the grid rather than rounded, so round
+        explicitly toward the safe side; epsilon absorbs float error on exact
+        multiples, e.g. 0.3 / 0.1.
+        """
+        if down:
+            return math.floor(value * scale + 1e-9) / scale
+        return math.ceil(value * scale - 1e-9) / scale
+
+    def _amount_limits(self, market_info: Dict[str, Any]) -> Tuple[Any, float, float, float]:
+        """
+        Parse amount precision and limits from market info.
+
+        Parsed once and stored on the (cached) market_info dict.
+
+        Returns:
+            (amount_precision, amount_scale, min_qty, max_qty) where
+            amount_scale is the number of amount steps per contract
+        """
+        limits = market_info.get('_amount_limits')
+        if limits is None:
+            precision = market_info.get('precision') or {}
+            amount = (market_info.get('limits') or {}).get('amount') or {}
+            amount_precision = precision.get('amount', 8)
+            limits = (
+                amount_precision,
+                self._precision_scale(amount_precision, market_info.get('precision_mode')),
+                float(amount.get('min') or 0.001),
+                float(amount.get('max') or 1000000)
+            )
+            market_info['_amount_limits'] = limits
+        return limits
+
+    def _price_scale(self, market_info: Dict[str, Any]) -> float:
+        """Price ticks per unit of quote, parsed once and stored on market_info."""
+        scale = market_info.get('_price_scale')
+        if scale is None:
+            precision = market_info.get('precision') or {}
+            scale = self._precision_scale(
+                precision.get('price', 2), market_info.get('precision_mode')
+            )
+            market_info['_price_scale'] = scale
+        return scale
+
     async def _calculate_position_size(
         self,
         trade: TradeSetup,
@@ -380,12 +637,10 @@ class OrderExecutor:
             qty = notional_usd / entry_price
 
             # Get precision and limits from market info
-            amount_precision = int(market_info.get('precision', {}).get('amount', 8))
-            min_qty = float(market_info.get('limits', {}).get('amount', {}).get('min', 0.001))
-            max_qty = float(market_info.get('limits', {}).get('amount', {}).get('max', 1000000))
+            amount_precision, amount_scale, min_qty, max_qty = self._amount_limits(market_info)
 
-            # Round to exchange precision
-            qty = round(qty, amount_precision)
+            # Floor to exchange step (never round up past the notional)
+            qty = self._snap_to_tick(qty, amount_scale, down=True)
 
             # Validate limits
             if qty < min_qty:
@@ -400,9 +655,8 @@ class OrderExecutor:
                 qty = max_qty
 
             logger.info(
-                f"💼 Position calculation: "
-                f"${notional_usd:.2f} / ${entry_price:.2f} = {qty} contracts "
-                f"(precision: {amount_precision}, min: {min_qty}, max: {max_qty})"
+                "💼 Position calculation: $%.2f / $%.2f = %s contracts (precision: %s, min: %s, max: %s)",
+                notional_usd, entry_price, qty, amount_precision, min_qty, max_qty
             )
 
             return qty
@@ -416,7 +670,8 @@ class OrderExecutor:
         symbol: str,
         direction: str,
         qty: float,
-        market_info: Dict[str, Any]
+        market_info: Dict[str, Any],
+        client: Optional[BybitClient] = None
     ) -> Optional[str]:
         """
         Place market entry order.
@@ -426,20 +681,22 @@ class OrderExecutor:
             direction: 'LONG' or 'SHORT'
             qty: Position size in contracts
             market_info: Market information
+            client: Connected client (fetched via _ensure_client if None)
 
         Returns:
             Order ID if successful, None otherwise
         """
         try:
-            client = await self._ensure_client()
+            client = client or await self._ensure_client()
 
             # Determine order side
             side = 'buy' if direction == 'LONG' else 'sell'
 
-            logger.info(f"📤 Placing MARKET {side.upper()} order: {qty} {symbol}")
+            logger.info("📤 Placing MARKET %s order: %s %s", side.upper(), qty, symbol)
 
             # Place market order using CCXT
-            order = await client.exchange.create_order(
+            order = await self._create_order(
+                client,
                 symbol=symbol,
                 type='market',
                 side=side,
@@ -451,14 +708,16 @@ class OrderExecutor:
 
             order_id = order.get('id') or order.get('info', {}).get('orderId')
 
-            logger.info(
-                f"✅ Entry order placed successfully\n"
-                f"   Order ID: {order_id}\n"
-                f"   Symbol: {symbol}\n"
-                f"   Side: {side.upper()}\n"
-                f"   Qty: {qty}\n"
-                f"   Status: {order.get('status')}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "✅ Entry order placed successfully\n"
+                    "   Order ID: %s\n"
+                    "   Symbol: %s\n"
+                    "   Side: %s\n"
+                    "   Qty: %s\n"
+                    "   Status: %s",
+                    order_id, symbol, side.upper(), qty, order.get('status')
+                )
 
             return str(order_id)
 
@@ -466,6 +725,248 @@ class OrderExecutor:
             logger.error(f"❌ Failed to place entry order: {e}", exc_info=True)
             return None
 
+    def _calculate_tp_levels(
+        self,
+        direction: str,
+        qty: float,
+        entry_price: float,
+        tp1_pct: Optional[float],
+        tp2_pct: Optional[float],
+        tp3_pct: Optional[float],
+        market_info: Dict[str, Any]
+    ) -> List[Tuple[str, float, float]]:
+        """
+        Calculate price and quantity for each configured TP level.
+
+        Returns:
+            List of (tp_name, tp_price, tp_qty) for TP levels that are set
+        """
+        price_scale = self._price_scale(market_info)
+        amount_scale = self._amount_limits(market_info)[1]
+
+        # TP allocation: 40% TP1, 30% TP2, 30% TP3
+        tp_allocations = (
+            ('tp1', tp1_pct, 0.4),
+            ('tp2', tp2_pct, 0.3),
+            ('tp3', tp3_pct, 0.3)
+        )
+
+        # TP is above entry for LONG, below for SHORT. Snap toward entry so a
+        # TP never lands past the intended level; TP quantities floor so the
+        # reduce-only legs never exceed the position.
+        is_long = direction == 'LONG'
+        price_step = entry_price / 100 if is_long else -entry_price / 100
+
+        return [
+            (
+                tp_name,
+                self._snap_to_tick(entry_price + tp_pct * price_step, price_scale, down=is_long),
+                self._snap_to_tick(qty * allocation, amount_scale, down=True)
+            )
+            for tp_name, tp_pct, allocation in tp_allocations
+            if tp_pct is not None
+        ]
+
+    def _calculate_sl_price(
+        self,
+        direction: str,
+        entry_price: float,
+        sl_pct: float,
+        market_info: Dict[str, Any]
+    ) -> float:
+        """Calculate stop-loss trigger price snapped to the exchange tick."""
+        price_scale = self._price_scale(market_info)
+
+        if direction == 'LONG':
+            sl_price = entry_price * (1 + sl_pct / 100)  # sl_pct is negative
+        else:  # SHORT
+            sl_price = entry_price * (1 - sl_pct / 100)
+
+        # Snap toward entry so the stop is never wider than planned
+        return self._snap_to_tick(sl_price, price_scale, down=direction != 'LONG')
+
+    async def _place_exit_orders_batch(
+        self,
+        symbol: str,
+        direction: str,
+        qty: float,
+        entry_price: float,
+        tp1_pct: Optional[float],
+        tp2_pct: Optional[float],
+        tp3_pct: Optional[float],
+        sl_pct: Optional[float],
+        market_info: Dict[str, Any],
+        trade_id: int,
+        client: Optional[BybitClient] = None
+    ) -> Optional[Tuple[Dict[str, str], Optional[str]]]:
+        """
+        Place TP limit orders and the SL order in a single batch request.
+
+        Uses Bybit's batch order endpoint (CCXT create_orders) so all exit
+        orders cost one round trip instead of one per order. Every order gets
+        a client order ID (Bybit orderLinkId) derived from the trade ID, so a
+        batch with an unknown outcome can be reconciled without touching
+        other trades' orders on the same symbol.
+
+        Returns:
+            (tp_order_ids, sl_order_id), or None if batch placement is not
+            supported or the request failed before any order was accepted
+
+        Raises:
+            OrderExecutionError: If the batch may have been accepted but its
+                orders could not be reconciled - falling back to single orders
+                would then duplicate reduce-only exits on the position
+        """
+        try:
+            client = client or await self._ensure_client()
+            if not client.exchange.has.get('createOrders'):
+                return None
+
+            if sl_pct is None:
+                logger.warning("⚠️ No SL percentage provided, using default -3%")
+                sl_pct = -3.0
+
+            # Determine order side (opposite of entry for closing)
+            side = 'sell' if direction == 'LONG' else 'buy'
+
+            tp_levels = self._calculate_tp_levels(
+                direction, qty, entry_price, tp1_pct, tp2_pct, tp3_pct, market_info
+            )
+            sl_price = self._calculate_sl_price(direction, entry_price, sl_pct, market_info)
+
+            # orderLinkId: unique per order, max 36 chars on Bybit
+            link_prefix = f"aa{trade_id}-{time.time_ns() // 1_000_000:x}"
+            client_ids = {name: f"{link_prefix}-{name}" for name, _, _ in tp_levels}
+            client_ids['sl'] = f"{link_prefix}-sl"
+
+            batch = [
+                {
+                    'symbol': symbol,
+                    'type': 'limit',
+                    'side': side,
+                    'amount': tp_qty,
+                    'price': tp_price,
+                    'params': {
+                        'reduceOnly': True,  # Only close position, never increase
+                        'postOnly': False,   # Can take liquidity
+                        'positionIdx': 0,
+                        'clientOrderId': client_ids[tp_name]
+                    }
+                }
+                for tp_name, tp_price, tp_qty in tp_levels
+            ]
+            batch.append({
+                'symbol': symbol,
+                'type': 'market',  # Market order when triggered
+                'side': side,
+                'amount': qty,
+                'params': {
+                    'stopLoss': sl_price,  # Bybit parameter
+                    'reduceOnly': True,
+                    'positionIdx': 0,
+                    'clientOrderId': client_ids['sl']
+                }
+            })
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "📤 Placing %d exit orders in one batch: TPs=%s, SL=$%s",
+                    len(batch), [(name, price) for name, price, _ in tp_levels], sl_price
+                )
+
+        except Exception as e:
+            logger.warning(f"⚠️ Batch exit order preparation failed, falling back to single orders: {e}")
+            return None
+
+        try:
+            orders = await client.exchange.create_orders(batch)
+
+        except (ccxt.NotSupported, ccxt.BadRequest) as e:
+            # Rejected as a whole before any order was accepted
+            logger.warning(f"⚠️ Batch exit order placement rejected, falling back to single orders: {e}")
+            return None
+
+        except ccxt.NetworkError as e:
+            # Bybit may have accepted the batch before the connection failed
+            logger.warning(f"⚠️ Batch exit order request failed ({e}), checking open orders before retrying")
+            return await self._reconcile_exit_batch(client, symbol, client_ids)
+
+        except Exception as e:
+            # Unknown outcome - don't risk duplicating exits on a live position
+            raise OrderExecutionError(f"Batch exit order placement failed: {e}") from e
+
+        def _order_id(order: Dict[str, Any]) -> Optional[str]:
+            order_id = order.get('id') or order.get('info', {}).get('orderId')
+            return str(order_id) if order_id else None
+
+        # Orders come back in submission order: TPs first, SL last
+        tp_order_ids = {}
+        for (tp_name, _, _), order in zip(tp_levels, orders):
+            order_id = _order_id(order)
+            if order_id:
+                tp_order_ids[tp_name] = order_id
+            else:
+                logger.error(f"❌ {tp_name.upper()} order rejected in batch: {order.get('info')}")
+
+        sl_order_id = _order_id(orders[len(tp_levels)]) if len(orders) > len(tp_levels) else None
+
+        return tp_order_ids, sl_order_id
+
+    async def _reconcile_exit_batch(
+        self,
+        client: BybitClient,
+        symbol: str,
+        client_ids: Dict[str, str]
+    ) -> Optional[Tuple[Dict[str, str], Optional[str]]]:
+        """
+        Find which orders of a failed exit batch reached the exchange.
+
+        Open orders on the symbol (regular and conditional) are matched to the
+        batch by the client order IDs it was sent with, so orders of other
+        trades on the same symbol are never claimed.
+
+        Args:
+            client_ids: Client order ID per exit ('tp1'..'tp3', 'sl')
+
+        Returns:
+            (tp_order_ids, sl_order_id) for the matched orders, or None if none
+            of the batch is open (safe to place single orders)
+
+        Raises:
+            OrderExecutionError: If open orders can't be fetched
+        """
+        try:
+            open_orders, trigger_orders = await asyncio.gather(
+                client.exchange.fetch_open_orders(symbol),
+                client.exchange.fetch_open_orders(symbol, params={'trigger': True})
+            )
+        except Exception as e:
+            raise OrderExecutionError(f"Could not reconcile exit batch for {symbol}: {e}") from e
+
+        exits_by_client_id = {client_id: name for name, client_id in client_ids.items()}
+
+        tp_order_ids = {}
+        sl_order_id = None
+        for order in open_orders + trigger_orders:
+            client_id = order.get('clientOrderId') or order.get('info', {}).get('orderLinkId')
+            name = exits_by_client_id.get(client_id)
+            if name is None:
+                continue
+            if name == 'sl':
+                sl_order_id = str(order['id'])
+            else:
+                tp_order_ids[name] = str(order['id'])
+
+        if not tp_order_ids and sl_order_id is None:
+            logger.info("ℹ️ No exit orders from the failed batch are open on %s", symbol)
+            return None
+
+        logger.warning(
+            "⚠️ Exit batch partially or fully accepted on %s: TPs=%s, SL=%s",
+            symbol, tp_order_ids, sl_order_id
+        )
+        return tp_order_ids, sl_order_id
+
     async def place_tp_orders(
         self,
         symbol: str,
@@ -475,7 +976,8 @@ class OrderExecutor:
         tp1_pct: Optional[float],
         tp2_pct: Optional[float],
         tp3_pct: Optional[float],
-        market_info: Dict[str, Any]
+        market_info: Dict[str, Any],
+        client: Optional[BybitClient] = None
     ) -> Dict[str, str]:
         """
         Place take-profit limit orders (reduceOnly).
@@ -492,6 +994,7 @@ class OrderExecutor:
             tp2_pct: TP2 percentage
             tp3_pct: TP3 percentage
             market_info: Market information
+            client: Connected client (fetched via _ensure_client if None)
 
         Returns:
             Dict mapping TP level to order ID: {'tp1': 'xxx', 'tp2': 'yyy', ...}
@@ -499,39 +1002,17 @@ class OrderExecutor:
         tp_order_ids = {}
 
         try:
-            client = await self._ensure_client()
-            price_precision = int(market_info.get('precision', {}).get('price', 2))
+            client = client or await self._ensure_client()
 
             # Determine order side (opposite of entry for closing)
             side = 'sell' if direction == 'LONG' else 'buy'
 
-            # TP allocation: 40% TP1, 30% TP2, 30% TP3
-            tp_allocations = {
-                'tp1': (tp1_pct, 0.4),
-                'tp2': (tp2_pct, 0.3),
-                'tp3': (tp3_pct, 0.3)
-            }
-
-            for tp_name, (tp_pct, allocation) in tp_allocations.items():
-                if tp_pct is None:
-                    continue
-
-                # Calculate TP price
-                if direction == 'LONG':
-                    tp_price = entry_price * (1 + tp_pct / 100)
-                else:  # SHORT
-                    tp_price = entry_price * (1 - tp_pct / 100)
-
-                # Round to exchange precision
-                tp_price = round(tp_price, price_precision)
-
-                # Calculate quantity for this TP level
-                tp_qty = round(qty * allocation, int(market_info.get('precision', {}).get('amount', 8)))
-
-                logger.info(f"📤 Placing {tp_name.upper()} order: {side.upper()} {tp_qty} @ ${tp_price}")
+            async def _place_one(tp_name: str, tp_price: float, tp_qty: float) -> str:
+                logger.info("📤 Placing %s order: %s %s @ $%s", tp_name.upper(), side.upper(), tp_qty, tp_price)
 
                 # Place limit order with reduceOnly
-                order = await client.exchange.create_order(
+                order = await self._create_order(
+                    client,
                     symbol=symbol,
                     type='limit',
                     side=side,
@@ -545,12 +1026,23 @@ class OrderExecutor:
                 )
 
                 order_id = order.get('id') or order.get('info', {}).get('orderId')
-                tp_order_ids[tp_name] = str(order_id)
+                return str(order_id)
 
-                logger.info(f"✅ {tp_name.upper()} order placed: {order_id}")
+            # Submit all TP levels concurrently (CCXT's enableRateLimit throttles requests)
+            pending = self._calculate_tp_levels(
+                direction, qty, entry_price, tp1_pct, tp2_pct, tp3_pct, market_info
+            )
+            results = await asyncio.gather(
+                *(_place_one(*level) for level in pending),
+                return_exceptions=True
+            )
 
-                # Small delay to avoid rate limits
-                await asyncio.sleep(0.1)
+            for (tp_name, _, _), result in zip(pending, results):
+                if isinstance(result, Exception):
+                    logger.error(f"❌ Failed to place {tp_name.upper()} order: {result}")
+                    continue
+                tp_order_ids[tp_name] = result
+                logger.info("✅ %s order placed: %s", tp_name.upper(), result)
 
             return tp_order_ids
 
@@ -565,7 +1057,8 @@ class OrderExecutor:
         qty: float,
         entry_price: float,
         sl_pct: Optional[float],
-        market_info: Dict[str, Any]
+        market_info: Dict[str, Any],
+        client: Optional[BybitClient] = None
     ) -> Optional[str]:
         """
         Place stop-loss order.
@@ -579,6 +1072,7 @@ class OrderExecutor:
             entry_price: Entry price
             sl_pct: Stop-loss percentage (negative, e.g., -3.0 for -3%)
             market_info: Market information
+            client: Connected client (fetched via _ensure_client if None)
 
         Returns:
             Order ID if successful, None otherwise
@@ -588,25 +1082,18 @@ class OrderExecutor:
                 logger.warning("⚠️ No SL percentage provided, using default -3%")
                 sl_pct = -3.0
 
-            client = await self._ensure_client()
-            price_precision = int(market_info.get('precision', {}).get('price', 2))
+            client = client or await self._ensure_client()
 
             # Determine order side (opposite of entry for closing)
             side = 'sell' if direction == 'LONG' else 'buy'
 
-            # Calculate SL price
-            if direction == 'LONG':
-                sl_price = entry_price * (1 + sl_pct / 100)  # sl_pct is negative
-            else:  # SHORT
-                sl_price = entry_price * (1 - sl_pct / 100)
-
-            # Round to exchange precision
-            sl_price = round(sl_price, price_precision)
+            sl_price = self._calculate_sl_price(direction, entry_price, sl_pct, market_info)
 
-            logger.info(f"📤 Placing STOP-LOSS order: {side.upper()} {qty} @ ${sl_price} (trigger)")
+            logger.info("📤 Placing STOP-LOSS order: %s %s @ $%s (trigger)", side.upper(), qty, sl_price)
 
             # Place stop-market order
-            order = await client.exchange.create_order(
+            order = await self._create_order(
+                client,
                 symbol=symbol,
                 type='market',  # Market order when triggered
                 side=side,
@@ -621,10 +1108,11 @@ class OrderExecutor:
             order_id = order.get('id') or order.get('info', {}).get('orderId')
 
             logger.info(
-                f"✅ Stop-loss order placed successfully\n"
-                f"   Order ID: {order_id}\n"
-                f"   Trigger Price: ${sl_price}\n"
-                f"   Type: Stop Market"
+                "✅ Stop-loss order placed successfully\n"
+                "   Order ID: %s\n"
+                "   Trigger Price: $%s\n"
+                "   Type: Stop Market",
+                order_id, sl_price
             )
 
             return str(order_id)
@@ -641,7 +1129,8 @@ class OrderExecutor:
         entry_price: float,
         activation_pct: float,
         distance_pct: float,
-        market_info: Dict[str, Any]
+        market_info: Dict[str, Any],
+        client: Optional[BybitClient] = None
     ) -> Optional[str]:
         """
         Setup trailing stop order.
@@ -658,13 +1147,14 @@ class OrderExecutor:
             activation_pct: Profit % to activate trailing (e.g., 2.0 for +2%)
             distance_pct: Trail distance % (e.g., 1.0 for 1% behind peak)
             market_info: Market information
+            client: Connected client (fetched via _ensure_client if None)
 
         Returns:
             Order ID if successful, None otherwise
         """
         try:
-            client = await self._ensure_client()
-            price_precision = int(market_info.get('precision', {}).get('price', 2))
+            client = client or await self._ensure_client()
+            price_scale = self._price_scale(market_info)
 
             # Calculate activation price
             if direction == 'LONG':
@@ -672,12 +1162,14 @@ class OrderExecutor:
             else:  # SHORT
                 activation_price = entry_price * (1 - activation_pct / 100)
 
-            activation_price = round(activation_price, price_precision)
+            # Snap toward entry, same as the TP levels
+            activation_price = self._snap_to_tick(activation_price, price_scale, down=direction == 'LONG')
 
             logger.info(
-                f"📤 Setting up TRAILING STOP:\n"
-                f"   Activation: ${activation_price} ({activation_pct:+.2f}%)\n"
-                f"   Trail Distance: {distance_pct}%"
+                "📤 Setting up TRAILING STOP:\n"
+                "   Activation: $%s (%+.2f%%)\n"
+                "   Trail Distance: %s%%",
+                activation_price, activation_pct, distance_pct
             )
 
             # Determine order side
@@ -685,7 +1177,8 @@ class OrderExecutor:
 
             # Place trailing stop order
             # Note: Bybit API varies by contract type, this is a general approach
-            order = await client.exchange.create_order(
+            order = await self._create_order(
+                client,
                 symbol=symbol,
                 type='market',
                 side=side,
@@ -700,7 +1193,7 @@ class OrderExecutor:
 
             order_id = order.get('id') or order.get('info', {}).get('orderId')
 
-            logger.info(f"✅ Trailing stop configured: {order_id}")
+            logger.info("✅ Trailing stop configured: %s", order_id)
 
             return str(order_id)
 
@@ -716,24 +1209,30 @@ class OrderExecutor:
         symbol: str,
         entry_order_id: Optional[str] = None,
         tp_order_ids: Optional[Dict[str, str]] = None,
-        sl_order_id: Optional[str] = None
+        sl_order_id: Optional[str] = None,
+        client: Optional[BybitClient] = None,
+        trailing_order_id: Optional[str] = None
     ) -> bool:
         """
         Cancel all orders for a trade.
 
-        Used for emergency cleanup if trade setup fails.
+        Used for emergency cleanup if trade setup fails. Only the trade's own
+        order IDs are cancelled - never cancel_all_orders, which would also
+        hit other trades on the same symbol.
 
         Args:
             symbol: Trading symbol
             entry_order_id: Entry order ID
             tp_order_ids: Dict of TP order IDs
             sl_order_id: SL order ID
+            trailing_order_id: Trailing stop order ID
+            client: Connected client (fetched via _ensure_client if None)
 
         Returns:
             True if all cancellations successful
         """
         try:
-            client = await self._ensure_client()
+            client = client or await self._ensure_client()
             success = True
 
             # Collect all order IDs
@@ -744,17 +1243,60 @@ class OrderExecutor:
                 order_ids.extend(tp_order_ids.values())
             if sl_order_id:
                 order_ids.append(sl_order_id)
+            if trailing_order_id:
+                order_ids.append(trailing_order_id)
+
+            logger.info("🗑️ Cancelling %d orders for %s", len(order_ids), symbol)
+
+            if not order_ids:
+                return success
+
+            # Prefer batch-cancel requests (one per _CANCEL_BATCH_LIMIT orders)
+            if client.exchange.has.get('cancelOrders'):
+                chunks = [
+                    order_ids[i:i + self._CANCEL_BATCH_LIMIT]
+                    for i in range(0, len(order_ids), self._CANCEL_BATCH_LIMIT)
+                ]
+                batch_results = await asyncio.gather(
+                    *(client.exchange.cancel_orders(chunk, symbol) for chunk in chunks),
+                    return_exceptions=True
+                )
 
-            logger.info(f"🗑️ Cancelling {len(order_ids)} orders for {symbol}")
+                # A batch request can succeed while single items in it fail -
+                # those come back as rejected entries, not as an exception
+                failed_ids = []
+                for chunk, result in zip(chunks, batch_results):
+                    if isinstance(result, Exception):
+                        logger.warning(f"   ⚠️ Batch cancel failed for {chunk}: {result}")
+                        failed_ids.extend(chunk)
+                        continue
+
+                    for i, order_id in enumerate(chunk):
+                        item = result[i] if i < len(result) else None
+                        if not item or item.get('status') == 'rejected' or not item.get('id'):
+                            logger.warning(f"   ⚠️ Batch cancel rejected order {order_id}: {(item or {}).get('info')}")
+                            failed_ids.append(order_id)
+                        else:
+                            logger.info("   ✅ Cancelled order: %s", order_id)
+
+                if not failed_ids:
+                    return success
+
+                logger.warning(f"   ⚠️ Cancelling {len(failed_ids)} orders individually")
+                order_ids = failed_ids
+
+            # Fallback: cancel concurrently (CCXT's enableRateLimit throttles requests)
+            results = await asyncio.gather(
+                *(self._cancel_order(client, order_id, symbol) for order_id in order_ids),
+                return_exceptions=True
+            )
 
-            for order_id in order_ids:
-                try:
-                    await client.exchange.cancel_order(order_id, symbol)
-                    logger.info(f"   ✅ Cancelled order: {order_id}")
-                    await asyncio.sleep(0.1)  # Rate limit protection
-                except Exception as e:
-                    logger.error(f"   ❌ Failed to cancel order {order_id}: {e}")
+            for order_id, result in zip(order_ids, results):
+                if isinstance(result, Exception):
+                    logger.error(f"   ❌ Failed to cancel order {order_id}: {result}")
                     success = False
+                else:
+                    logger.info("   ✅ Cancelled order: %s", order_id)
 
             return success
 
@@ -762,6 +1304,61 @@ class OrderExecutor:
             logger.error(f"❌ Failed to cancel orders: {e}")
             return False
 
+    async def wait_for_fill(
+        self,
+        symbol: str,
+        order_id: str,
+        timeout: float = 2.0,
+        client: Optional[BybitClient] = None
+    ) -> bool:
+        """
+        Wait until an order is filled, returning as soon as the fill is seen.
+
+        Checks the order once over HTTP (market orders are usually filled
+        already), then follows the private order stream when the WebSocket
+        session is up, or polls every 0.25s otherwise - all against one
+        absolute deadline.
+
+        Args:
+            symbol: Trading symbol
+            order_id: Exchange order ID
+            timeout: Seconds to wait before giving up (default: 2.0)
+            client: Connected client (fetched via _ensure_client if None)
+
+        Returns:
+            True if the order was filled before the deadline
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        order_id = str(order_id)
+
+        try:
+            client = client or await self._ensure_client()
+            ws = client.ws_exchange
+            watch = ws is not None and ws.has.get('watchOrders')
+
+            order = await client.exchange.fetch_order(order_id, symbol, params={'acknowledged': True})
+            if order.get('status') == 'closed':
+                return True
+
+            while (remaining := deadline - loop.time()) > 0:
+                if watch:
+                    orders = await asyncio.wait_for(ws.watch_orders(symbol), remaining)
+                else:
+                    await asyncio.sleep(min(0.25, remaining))
+                    orders = [await client.exchange.fetch_order(order_id, symbol, params={'acknowledged': True})]
+
+                for order in orders:
+                    if str(order.get('id')) == order_id and order.get('status') == 'closed':
+                        return True
+
+        except asyncio.TimeoutError:
+            pass
+        except Exception as e:
+            logger.warning(f"⚠️ Could not confirm fill for order {order_id}: {e}")
+
+        return False
+
     async def sync_position(
         self,
         symbol: str,
@@ -796,14 +1393,8 @@ class OrderExecutor:
             positions = await client.exchange.fetch_positions([symbol])
 
             if not positions:
-                logger.warning(f"⚠️ No position found for {symbol}")
-                return {
-                    'position_size': 0,
-                    'entry_price': 0,
-                    'unrealized_pnl': 0,
-                    'side': 'none',
-                    'synced': False
-                }
+                logger.warning("⚠️ No position found for %s", symbol)
+                return dict(_EMPTY_POSITION)
 
             position = positions[0]
 
@@ -816,33 +1407,28 @@ class OrderExecutor:
             }
 
             logger.info(
-                f"📊 Position sync for {symbol}:\n"
-                f"   Size: {position_info['position_size']} contracts\n"
-                f"   Entry: ${position_info['entry_price']}\n"
-                f"   Unrealized PnL: ${position_info['unrealized_pnl']:.2f}\n"
-                f"   Side: {position_info['side']}"
+                "📊 Position sync for %s:\n"
+                "   Size: %s contracts\n"
+                "   Entry: $%s\n"
+                "   Unrealized PnL: $%.2f\n"
+                "   Side: %s",
+                symbol, position_info['position_size'], position_info['entry_price'],
+                position_info['unrealized_pnl'], position_info['side']
             )
 
             # Check if position matches expected
             expected_side = trade.direction.lower()
             if position_info['side'] != expected_side and position_info['position_size'] > 0:
                 logger.warning(
-                    f"⚠️ Position side mismatch! "
-                    f"Expected: {expected_side}, Actual: {position_info['side']}"
+                    "⚠️ Position side mismatch! Expected: %s, Actual: %s",
+                    expected_side, position_info['side']
                 )
 
             return position_info
 
         except Exception as e:
-            logger.error(f"❌ Failed to sync position: {e}")
-            return {
-                'position_size': 0,
-                'entry_price': 0,
-                'unrealized_pnl': 0,
-                'side': 'none',
-                'synced': False,
-                'error': str(e)
-            }
+            logger.error("❌ Failed to sync position: %s", e)
+            return {**_EMPTY_POSITION, 'error': str(e)}
 
     async def close(self):
         """
@@ -854,44 +1440,410 @@ class OrderExecutor:
             await self.client.close()
             logger.info("✅ OrderExecutor client closed")
 
+    async def __aenter__(self) -> "OrderExecutor":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
 
 # ==========================================
 # HELPER FUNCTIONS
 # ==========================================
 
-async def execute_live_trade(trade_id: int, db: AsyncSession) -> bool:
+# Log templates shared by the helpers below
+_MSG_TRADE_NOT_FOUND = "❌ Trade %s not found"
+_MSG_EXECUTE_FAILED = "❌ Failed to execute live trade %s: %s"
+_MSG_CANCEL_FAILED = "❌ Failed to cancel trade orders %s: %s"
+_MSG_ALREADY_EXECUTED = "ℹ️ Trade %s already executed, skipping duplicate call"
+_MSG_ALREADY_CANCELLED = "ℹ️ Orders for trade %s already cancelled, skipping duplicate call"
+_MSG_EXECUTION_IN_FLIGHT = "ℹ️ Trade %s is already executing, waiting for that result"
+
+# Legacy notes entry holding order IDs for trades predating order_tracking
+_ORDER_IDS_MARKER = '[ORDER_IDS]'
+
+# Batch trade lookup, built once (single trades go through db.get)
+_SELECT_TRADES_BY_IDS = select(TradeSetup).where(
+    TradeSetup.id.in_(bindparam('trade_ids', expanding=True))
+)
+
+# Shared executor so the exchange session and loaded markets persist across calls
+_order_executor: Optional[OrderExecutor] = None
+
+# Shared worker pool that trade executions are queued on (see TradeExecutionPool)
+_trade_execution_pool: Optional["TradeExecutionPool"] = None
+
+# Helper errors seen recently (repr -> monotonic time). Error storms log the
+# traceback once per window instead of formatting it for every failed trade.
+_recent_errors: "OrderedDict[str, float]" = OrderedDict()
+_ERROR_TRACEBACK_WINDOW = 60.0  # seconds
+_MAX_RECENT_ERRORS = 256
+
+
+def _traceback_wanted(e: Exception) -> bool:
+    """Whether a helper error log should include the traceback."""
+    if logger.isEnabledFor(logging.DEBUG):
+        return True
+
+    key = repr(e)
+    now = time.monotonic()
+    seen_at = _recent_errors.get(key)
+    if seen_at is not None and now - seen_at < _ERROR_TRACEBACK_WINDOW:
+        return False
+
+    _recent_errors[key] = now
+    _recent_errors.move_to_end(key)
+    if len(_recent_errors) > _MAX_RECENT_ERRORS:
+        _recent_errors.popitem(last=False)
+    return True
+
+
+# Trades executed / cancelled successfully in the last minute (trade_id ->
+# monotonic time). Retries and scheduler races for the same trade return
+# early instead of paying the DB fetch and exchange round trips again.
+_recent_executions: "OrderedDict[int, float]" = OrderedDict()
+_recent_cancellations: "OrderedDict[int, float]" = OrderedDict()
+_RECENT_TRADE_WINDOW = 60.0  # seconds
+_MAX_RECENT_TRADES = 1024
+
+# Executions currently running (trade_id -> future with the result). Registered
+# before the first await, so a concurrent call for the same trade waits for the
+# running one instead of placing a second set of orders.
+_executions_in_flight: Dict[int, asyncio.Future] = {}
+
+
+def _recently_done(recent: "OrderedDict[int, float]", trade_id: int) -> bool:
+    """Whether trade_id succeeded within the window (expired entries are dropped)."""
+    done_at = recent.get(trade_id)
+    if done_at is None:
+        return False
+    if time.monotonic() - done_at < _RECENT_TRADE_WINDOW:
+        return True
+    del recent[trade_id]
+    return False
+
+
+def _mark_done(recent: "OrderedDict[int, float]", trade_id: int):
+    """Record a successful execution/cancellation, evicting the oldest entry."""
+    recent[trade_id] = time.monotonic()
+    recent.move_to_end(trade_id)
+    if len(recent) > _MAX_RECENT_TRADES:
+        recent.popitem(last=False)
+
+
+@db_retry
+async def _write_order_tracking(trade_id: int, order_tracking: Dict[str, Any], notes: str):
+    """Store a trade's order IDs on a fresh session (retried on transient DB errors)."""
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(TradeSetup)
+            .where(TradeSetup.id == trade_id)
+            .values(order_tracking=order_tracking, notes=notes)
+        )
+        await session.commit()
+
+
+def get_order_executor() -> OrderExecutor:
+    """
+    Get or create the global OrderExecutor instance.
+
+    Returns:
+        OrderExecutor instance (closed via close_order_executor on shutdown)
+    """
+    global _order_executor
+
+    if _order_executor is None:
+        _order_executor = OrderExecutor()
+    return _order_executor
+
+
+async def close_order_executor():
+    """Finish queued trades, then flush and close the global OrderExecutor, if one was created."""
+    global _order_executor
+
+    # Queued trades still need the executor
+    await close_trade_execution_pool()
+
+    if _order_executor is not None:
+        await _order_executor.close()
+        _order_executor = None
+
+
+async def execute_live_trade(trade_id: int, db: AsyncSession, force_demo: bool = True) -> bool:
     """
     Convenience function to execute a live trade by ID.
 
+    Callers that already hold the TradeSetup should use
+    execute_live_trade_obj and skip the fetch.
+
     Args:
         trade_id: TradeSetup ID
-        db: Database session
+        db: Database session from the shared pool (AsyncSessionLocal or get_db)
+        force_demo: Force demo mode (default: True for safety)
 
     Returns:
         True if execution successful
     """
+    if _recently_done(_recent_executions, trade_id):
+        logger.info(_MSG_ALREADY_EXECUTED, trade_id)
+        return True
+
     try:
-        # Fetch trade from database
-        result = await db.execute(
-            select(TradeSetup).where(TradeSetup.id == trade_id)
-        )
-        trade = result.scalar_one_or_none()
+        # Fetch trade by primary key (identity map hit if already loaded)
+        trade = await db.get(TradeSetup, trade_id)
 
         if not trade:
-            logger.error(f"❌ Trade {trade_id} not found")
+            logger.error(_MSG_TRADE_NOT_FOUND, trade_id)
             return False
 
-        # Execute trade
-        executor = OrderExecutor()
-        success = await executor.execute_trade(trade, db)
-        await executor.close()
+    except Exception as e:
+        logger.error(_MSG_EXECUTE_FAILED, trade_id, e, exc_info=_traceback_wanted(e))
+        return False
+
+    return await execute_live_trade_obj(trade, db, force_demo=force_demo)
 
-        return success
 
+async def execute_live_trade_obj(trade: TradeSetup, db: AsyncSession, force_demo: bool = True) -> bool:
+    """
+    Execute an already loaded live trade on the shared executor.
+
+    Args:
+        trade: TradeSetup instance
+        db: Database session the trade was loaded with
+        force_demo: Force demo mode (default: True for safety)
+
+    Returns:
+        True if execution successful
+    """
+    trade_id = trade.id
+    if _recently_done(_recent_executions, trade_id):
+        logger.info(_MSG_ALREADY_EXECUTED, trade_id)
+        return True
+
+    in_flight = _executions_in_flight.get(trade_id)
+    if in_flight is not None:
+        logger.info(_MSG_EXECUTION_IN_FLIGHT, trade_id)
+        # Shielded - cancelling this waiter must not cancel the shared result
+        return await asyncio.shield(in_flight)
+
+    future = asyncio.get_running_loop().create_future()
+    _executions_in_flight[trade_id] = future
+    success = False
+
+    try:
+        executor = get_order_executor()
+        success = await executor.execute_trade(trade, db, force_demo=force_demo)
+
+    except Exception as e:
+        logger.error(_MSG_EXECUTE_FAILED, trade_id, e, exc_info=_traceback_wanted(e))
+
+    finally:
+        # Also runs on cancellation, so waiters are never left hanging
+        if success:
+            _mark_done(_recent_executions, trade_id)
+        del _executions_in_flight[trade_id]
+        future.set_result(success)
+
+    return success
+
+
+class TradeExecutionPool:
+    """
+    Worker pool that executes queued trades.
+
+    Callers submit trades without waiting for earlier ones: while one worker
+    waits on an exchange acknowledgement the next trade is already being
+    placed, including trades from back-to-back webhooks. The worker count
+    also bounds how many trades hit the exchange at once. Each job gets its
+    own pooled session, since a session must not be shared between
+    concurrent workers.
+    """
+
+    def __init__(self, workers: int = 8):
+        """
+        Initialize TradeExecutionPool.
+
+        Args:
+            workers: Number of trades executing at once (default: 8)
+        """
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker_count = workers
+        self._workers: List[asyncio.Task] = []
+
+    def start(self):
+        """Start the worker tasks (idempotent; submit() starts them lazily)."""
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self._worker_count)
+            ]
+
+    async def submit(
+        self,
+        trade_id: int,
+        force_demo: bool = True,
+        trade: Optional[TradeSetup] = None
+    ) -> asyncio.Future:
+        """
+        Queue a trade for execution.
+
+        Args:
+            trade_id: TradeSetup ID
+            force_demo: Force demo mode (default: True for safety)
+            trade: Already loaded, unmodified trade - attached to the job's
+                session without a second SELECT (loaded by ID if None)
+
+        Returns:
+            Future resolving to the execution result
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((trade_id, trade, force_demo, future))
+        return future
+
+    async def _worker(self):
+        while True:
+            trade_id, trade, force_demo, future = await self._queue.get()
+            try:
+                async with AsyncSessionLocal() as db:
+                    if trade is None:
+                        result = await execute_live_trade(trade_id, db, force_demo=force_demo)
+                    else:
+                        trade = await db.merge(trade, load=False)
+                        result = await execute_live_trade_obj(trade, db, force_demo=force_demo)
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    async def close(self):
+        """Finish queued trades, then stop the workers."""
+        if self._workers:
+            await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+
+def get_trade_execution_pool() -> TradeExecutionPool:
+    """
+    Get or create the global TradeExecutionPool instance.
+
+    Returns:
+        TradeExecutionPool instance (closed via close_order_executor on shutdown)
+    """
+    global _trade_execution_pool
+
+    if _trade_execution_pool is None:
+        _trade_execution_pool = TradeExecutionPool()
+    return _trade_execution_pool
+
+
+async def close_trade_execution_pool():
+    """Finish queued trades and stop the global pool's workers, if one was created."""
+    global _trade_execution_pool
+
+    if _trade_execution_pool is not None:
+        await _trade_execution_pool.close()
+        _trade_execution_pool = None
+
+
+async def execute_live_trades(trade_ids: List[int], force_demo: bool = True) -> List[bool]:
+    """
+    Execute several live trades concurrently.
+
+    All trades are loaded with one query up front, then queued on the shared
+    TradeExecutionPool, which runs each on its own pooled session and bounds
+    how many trades hit the exchange at once - across concurrent callers,
+    not just within one call. The trades share the global executor and
+    client.
+
+    Args:
+        trade_ids: TradeSetup IDs (committed, so every session can load them)
+        force_demo: Force demo mode (default: True for safety)
+
+    Returns:
+        Success flag per trade ID, in input order
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(_SELECT_TRADES_BY_IDS, {'trade_ids': trade_ids})
+            trades = {trade.id: trade for trade in result.scalars()}
     except Exception as e:
-        logger.error(f"❌ Failed to execute live trade {trade_id}: {e}", exc_info=True)
+        logger.error("❌ Failed to load live trades %s: %s", trade_ids, e, exc_info=_traceback_wanted(e))
+        return [False] * len(trade_ids)
+
+    pool = get_trade_execution_pool()
+
+    async def _execute_one(trade_id: int) -> bool:
+        trade = trades.get(trade_id)
+        if not trade:
+            logger.error(_MSG_TRADE_NOT_FOUND, trade_id)
+            return False
+        return await (await pool.submit(trade_id, force_demo, trade))
+
+    results = await asyncio.gather(
+        *(_execute_one(trade_id) for trade_id in trade_ids),
+        return_exceptions=True
+    )
+
+    for trade_id, outcome in zip(trade_ids, results):
+        if isinstance(outcome, Exception):
+            logger.error(_MSG_EXECUTE_FAILED, trade_id, outcome, exc_info=_traceback_wanted(outcome))
+
+    return [outcome is True for outcome in results]
+
+
+def _tracked_order_ids(trade: TradeSetup) -> Optional[Dict[str, Any]]:
+    """
+    Get the exchange order IDs recorded for a trade.
+
+    Order IDs live in order_tracking; the notes fallback covers trades
+    executed before the column existed.
+
+    Returns:
+        Order tracking dict, or None if the trade has no recorded orders
+    """
+    if trade.order_tracking:
+        return trade.order_tracking
+
+    notes = trade.notes
+    idx = notes.rfind(_ORDER_IDS_MARKER) if notes else -1
+    if idx < 0:
+        return None
+
+    # Parse order IDs (last entry is the most recent execution); slicing the
+    # suffix skips copying the rest of the notes, and orjson skips whitespace
+    return orjson.loads(notes[idx + len(_ORDER_IDS_MARKER):])
+
+
+async def _cancel_tracked_orders(executor: OrderExecutor, trade: TradeSetup) -> bool:
+    """Cancel the recorded orders of an already loaded trade."""
+    trade_id = trade.id
+    if _recently_done(_recent_cancellations, trade_id):
+        logger.info(_MSG_ALREADY_CANCELLED, trade_id)
+        return True
+
+    order_data = _tracked_order_ids(trade)
+    if not order_data:
+        logger.warning("⚠️ No order IDs found for trade %s", trade_id)
         return False
 
+    success = await executor.cancel_orders(
+        symbol=trade.effective_symbol,
+        entry_order_id=order_data.get('entry_order_id'),
+        tp_order_ids=order_data.get('tp_order_ids'),
+        sl_order_id=order_data.get('sl_order_id'),
+        trailing_order_id=order_data.get('trailing_order_id')
+    )
+
+    if success:
+        _mark_done(_recent_cancellations, trade_id)
+    return success
+
 
 async def cancel_trade_orders(trade_id: int, db: AsyncSession) -> bool:
     """
@@ -899,47 +1851,71 @@ async def cancel_trade_orders(trade_id: int, db: AsyncSession) -> bool:
 
     Args:
         trade_id: TradeSetup ID
-        db: Database session
+        db: Database session from the shared pool (AsyncSessionLocal or get_db)
 
     Returns:
         True if cancellation successful
     """
+    if _recently_done(_recent_cancellations, trade_id):
+        logger.info(_MSG_ALREADY_CANCELLED, trade_id)
+        return True
+
     try:
-        # Fetch trade from database
-        result = await db.execute(
-            select(TradeSetup).where(TradeSetup.id == trade_id)
-        )
-        trade = result.scalar_one_or_none()
+        # Fetch trade by primary key (identity map hit if already loaded)
+        trade = await db.get(TradeSetup, trade_id)
 
         if not trade:
-            logger.error(f"❌ Trade {trade_id} not found")
+            logger.error(_MSG_TRADE_NOT_FOUND, trade_id)
             return False
 
-        # Extract order IDs from notes
-        import json
-        if not trade.notes or '[ORDER_IDS]' not in trade.notes:
-            logger.warning(f"⚠️ No order IDs found for trade {trade_id}")
-            return False
+        return await _cancel_tracked_orders(get_order_executor(), trade)
 
-        # Parse order IDs
-        order_data_str = trade.notes.split('[ORDER_IDS]')[1].strip()
-        order_data = json.loads(order_data_str)
-
-        # Cancel orders
-        executor = OrderExecutor()
-        success = await executor.cancel_orders(
-            symbol=trade.ccxt_symbol or trade.symbol,
-            entry_order_id=order_data.get('entry_order_id'),
-            tp_order_ids=order_data.get('tp_order_ids'),
-            sl_order_id=order_data.get('sl_order_id')
-        )
-        await executor.close()
+    except Exception as e:
+        logger.error(_MSG_CANCEL_FAILED, trade_id, e, exc_info=_traceback_wanted(e))
+        return False
 
-        return success
 
+async def cancel_trade_orders_bulk(trade_ids: List[int], db: AsyncSession) -> List[bool]:
+    """
+    Cancel the orders of several trades concurrently.
+
+    All trades are loaded with one query before the cancellations fire.
+    Cancelling only reads the loaded trades, so the session is not used
+    by the concurrent tasks.
+
+    Args:
+        trade_ids: TradeSetup IDs
+        db: Database session from the shared pool (AsyncSessionLocal or get_db)
+
+    Returns:
+        Success flag per trade ID, in input order
+    """
+    try:
+        result = await db.execute(_SELECT_TRADES_BY_IDS, {'trade_ids': trade_ids})
+        trades = {trade.id: trade for trade in result.scalars()}
     except Exception as e:
-        logger.error(f"❌ Failed to cancel trade orders {trade_id}: {e}", exc_info=True)
-        return False
+        logger.error("❌ Failed to load trades %s for cancellation: %s", trade_ids, e, exc_info=_traceback_wanted(e))
+        return [False] * len(trade_ids)
+
+    executor = get_order_executor()
+
+    async def _cancel_one(trade_id: int) -> bool:
+        trade = trades.get(trade_id)
+        if not trade:
+            logger.error(_MSG_TRADE_NOT_FOUND, trade_id)
+            return False
+        return await _cancel_tracked_orders(executor, trade)
+
+    results = await asyncio.gather(
+        *(_cancel_one(trade_id) for trade_id in trade_ids),
+        return_exceptions=True
+    )
+
+    for trade_id, outcome in zip(trade_ids, results):
+        if isinstance(outcome, Exception):
+            logger.error(_MSG_CANCEL_FAILED, trade_id, outcome, exc_info=_traceback_wanted(outcome))
+
+    return [outcome is True for outcome in results]
 
 
 # ==========================================
@@ -952,8 +1928,6 @@ if __name__ == "__main__":
 
     This demonstrates the complete flow of executing a live trade.
     """
-    import asyncio
-    from app.database.database import AsyncSessionLocal
 
     async def example_execution():
         """Example: Execute a trade from database"""
@@ -973,25 +1947,43 @@ if __name__ == "__main__":
 
             print(f"Executing trade: {trade.symbol} {trade.direction}")
 
-            # Execute trade
-            executor = OrderExecutor()
-            success = await executor.execute_trade(trade, db)
-
-            if success:
-                print("✅ Trade executed successfully!")
-
-                # Sync position to verify
-                await asyncio.sleep(2)  # Wait for orders to fill
-                position_info = await executor.sync_position(
-                    trade.ccxt_symbol or trade.symbol,
-                    db,
-                    trade
-                )
-                print(f"Position info: {position_info}")
-            else:
-                print("❌ Trade execution failed")
-
-            await executor.close()
+            try:
+                # Execute trade (already loaded - no second fetch)
+                executor = get_order_executor()
+                success = await execute_live_trade_obj(trade, db)
+
+                if success:
+                    print("✅ Trade executed successfully!")
+
+                    # Sync position once the entry fills (or after 2s). Don't copy a
+                    # fixed asyncio.sleep() here: it costs the full delay even when the
+                    # fill lands in milliseconds, and is still a guess when it doesn't.
+                    # execute_trade() returns after every order is acknowledged, so the
+                    # fill is the only thing left to wait for.
+                    await executor.wait_for_fill(
+                        trade.effective_symbol,
+                        trade.order_tracking['entry_order_id'],
+                        timeout=2.0
+                    )
+                    position_info = await executor.sync_position(
+                        trade.effective_symbol,
+                        db,
+                        trade
+                    )
+                    print(f"Position info: {position_info}")
+                else:
+                    print("❌ Trade execution failed")
+            finally:
+                # Runs even if execution raises, so the exchange session never leaks
+                await close_order_executor()
+
+    # Standalone runs use uvloop when available (installed with uvicorn[standard],
+    # not available on Windows); the API process already gets it from uvicorn
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 
     # Run example
     # asyncio.run(example_execution())
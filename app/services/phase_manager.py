@@ -12,15 +12,18 @@ Key Features:
 - Dynamic promotion criteria based on OPTIMIZE_FOR_WIN_RATE setting
 """
 
+import asyncio
 import logging
+import math
+import time
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Optional, Tuple, List
-from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
-from scipy import stats
-import numpy as np
+from sqlalchemy import Float, Row, cast, select, update, func, and_, inspect, lambda_stmt
 
+from app.database.database import AsyncSessionLocal
 from app.database.models import TradeSetup
 from app.database.baseline_models import BaselineTrade
 from app.database.strategy_models import StrategyPerformance, StrategySimulation
@@ -31,6 +34,72 @@ from app.models.strategy_types import TradePhaseInfo, StrategyConfig
 logger = logging.getLogger(__name__)
 
 
+# Numeric(5, 2) values written to SignalQuality, built once
+_TWO_PLACES = Decimal('0.01')
+_FAST_TRACK_CONFIDENCE = Decimal('85.00')
+
+# Constant fields of the TradePhaseInfo dicts determine_phase returns; each
+# result is a shallow copy with the per-call fields merged in
+_PHASE_I_INFO = TradePhaseInfo(phase='I', phase_name='Data Collection', best_strategy=None)
+_POOR_SIGNAL_INFO = TradePhaseInfo(
+    phase='I', phase_name='Poor Signal - Skipped', baseline_needed=0, best_strategy=None
+)
+_PHASE_II_INFO = TradePhaseInfo(phase='II', phase_name='Strategy Optimization', best_strategy=None)
+_PHASE_III_INFO = TradePhaseInfo(phase='III', phase_name='Live Trading')
+
+# Two-sided z-scores, i.e. stats.norm.ppf((1 + confidence) / 2)
+_Z_SCORES = {0.90: 1.6448536269514722, 0.95: 1.959963984540054, 0.99: 2.5758293035489004}
+
+
+@lru_cache(maxsize=4096)
+def _wilson_interval(successes: int, trials: int, confidence: float) -> Tuple[float, float]:
+    """Wilson score interval in percent (trials > 0); pure scalar math, memoized"""
+    z = _Z_SCORES.get(confidence)
+    if z is None:
+        # SciPy only for untabulated confidence levels (slow cold import)
+        from scipy import stats
+        z = float(stats.norm.ppf((1 + confidence) / 2))
+
+    p_hat = successes / trials
+    denominator = 1 + z**2 / trials
+    center = (p_hat + z**2 / (2 * trials)) / denominator
+    spread = z * math.sqrt(p_hat * (1 - p_hat) / trials + z**2 / (4 * trials**2)) / denominator
+
+    ci_lower = max(0, (center - spread) * 100)
+    ci_upper = min(100, (center + spread) * 100)
+
+    return ci_lower, ci_upper
+
+
+@dataclass(slots=True)
+class EligibilityCriteria:
+    """Outcome of a Phase III eligibility check, criterion by criterion"""
+    eligible: bool = False
+    win_rate: float = 0.0
+    risk_reward: float = 0.0
+    expected_value: float = 0.0
+    duration: float = 0.0
+    has_valid_sl: bool = False
+    meets_wr: bool = False
+    meets_rr: bool = False
+    meets_ev: bool = False
+    meets_duration: bool = False
+    sl_tp_constraint: bool = False
+    actual_rr_verified: bool = False
+    reason: str = ''
+
+    def to_dict(self) -> Dict[str, any]:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+@dataclass
+class PhaseContext:
+    """Inputs shared by one phase decision and its summary"""
+    baseline_stats: Dict
+    signal_quality: Optional[SignalQuality]
+    strategies: Optional[List[Row]] = None  # Summary rows, loaded on demand
+
+
 class PhaseManager:
     """
     Enhanced phase manager with high-WR optimization support
@@ -52,9 +121,14 @@ class PhaseManager:
     NORMAL_SIGNAL_TRADES = 30      # Standard baseline collection
     MARGINAL_SIGNAL_TRADES = 40    # Marginal signals need more data
 
+    # Baseline stats are plain data, so they can be shared across sessions for
+    # a moment - webhook bursts for one signal reuse a single aggregate
+    BASELINE_CACHE_TTL = 2.0       # seconds
+
     def __init__(self):
         """Initialize the phase manager"""
         self.config = PhaseConfig
+        self._baseline_cache: Dict[Tuple[str, str, str], Tuple[float, Dict]] = {}
         logger.info(
             f"✅ PhaseManager initialized - Mode: "
             f"{'HIGH-WR' if self.config.OPTIMIZE_FOR_WIN_RATE else 'BALANCED'}"
@@ -65,20 +139,42 @@ class PhaseManager:
         db: AsyncSession,
         symbol: str,
         direction: str,
-        webhook_source: str
+        webhook_source: str,
+        context: Optional[PhaseContext] = None
     ) -> TradePhaseInfo:
         """
         Determine current phase with adaptive logic
 
+        Args:
+            context: Preloaded inputs (from _load_context); loaded here if None
+
         Returns:
             TradePhaseInfo with phase details and recommendations
         """
-        # Get baseline statistics
-        baseline_stats = await self._get_baseline_stats(db, symbol, direction, webhook_source)
-        baseline_count = baseline_stats['completed_count']
+        if context is None:
+            # Fast path: below POOR_SIGNAL_MIN_TRADES no early decision is possible
+            # and every adaptive requirement is higher, so the phase is Phase I -
+            # one baseline query (cached for _load_context), no concurrent context load
+            baseline_stats = await self._get_cached_baseline_stats(db, symbol, direction, webhook_source)
+            baseline_count = baseline_stats['completed_count']
+            if baseline_count < self.POOR_SIGNAL_MIN_TRADES and baseline_count < self.STRONG_SIGNAL_TRADES:
+                # Same requirement the full path reports (signal quality can lower it)
+                signal_quality = await self._get_signal_quality(db, symbol, direction, webhook_source)
+                required_baseline = await self._get_adaptive_baseline_requirement(
+                    baseline_stats, signal_quality
+                )
+                return {
+                    **_PHASE_I_INFO,
+                    'baseline_completed': baseline_count,
+                    'baseline_needed': required_baseline,
+                    'description': f'Collecting baseline data ({baseline_count}/{required_baseline})'
+                }
 
-        # Get signal quality
-        signal_quality = await self._get_signal_quality(db, symbol, direction, webhook_source)
+            context = await self._load_context(db, symbol, direction, webhook_source)
+
+        baseline_stats = context.baseline_stats
+        baseline_count = baseline_stats['completed_count']
+        signal_quality = context.signal_quality
 
         # Phase I: Check for early decisions
         if baseline_count < self.config.MIN_BASELINE_TRADES:
@@ -96,14 +192,12 @@ class PhaseManager:
 
         if baseline_count < required_baseline:
             # Still in Phase I
-            return TradePhaseInfo(
-                phase='I',
-                phase_name='Data Collection',
-                baseline_completed=baseline_count,
-                baseline_needed=required_baseline,
-                best_strategy=None,
-                description=f'Collecting baseline data ({baseline_count}/{required_baseline})'
-            )
+            return {
+                **_PHASE_I_INFO,
+                'baseline_completed': baseline_count,
+                'baseline_needed': required_baseline,
+                'description': f'Collecting baseline data ({baseline_count}/{required_baseline})'
+            }
 
         # Phase II or III: Check for eligible strategies
         best_strategy = await self._get_best_eligible_strategy(
@@ -112,27 +206,97 @@ class PhaseManager:
 
         if best_strategy:
             # Phase III: Live trading
-            return TradePhaseInfo(
-                phase='III',
-                phase_name='Live Trading',
-                baseline_completed=baseline_count,
-                best_strategy=best_strategy,
-                description=f"Using {best_strategy['strategy_name']} - "
-                          f"WR: {best_strategy.get('win_rate', 0):.1f}%, "
-                          f"RR: {best_strategy.get('risk_reward', 0):.2f}"
-            )
+            return {
+                **_PHASE_III_INFO,
+                'baseline_completed': baseline_count,
+                'best_strategy': best_strategy,
+                'description': f"Using {best_strategy['strategy_name']} - "
+                               f"WR: {best_strategy.get('win_rate', 0):.1f}%, "
+                               f"RR: {best_strategy.get('risk_reward', 0):.2f}"
+            }
         else:
             # Phase II: Strategy optimization
-            strategies = await self._get_all_strategies(db, symbol, direction, webhook_source)
-            strategy_count = len(strategies) if strategies else 0
-
-            return TradePhaseInfo(
-                phase='II',
-                phase_name='Strategy Optimization',
-                baseline_completed=baseline_count,
-                best_strategy=None,
-                description=f'Testing {strategy_count} strategies via paper trading'
-            )
+            if context.strategies is not None:
+                strategy_count = len(context.strategies)
+            else:
+                strategy_count = await self._count_strategies(db, symbol, direction, webhook_source)
+
+            return {
+                **_PHASE_II_INFO,
+                'baseline_completed': baseline_count,
+                'description': f'Testing {strategy_count} strategies via paper trading'
+            }
+
+    async def _load_context(
+        self,
+        db: AsyncSession,
+        symbol: str,
+        direction: str,
+        webhook_source: str,
+        include_strategies: bool = False
+    ) -> PhaseContext:
+        """
+        Load baseline stats (briefly cached), signal quality and optionally the
+        strategy summaries for one decision, as concurrent queries
+
+        Baseline stats and strategy summaries are plain data and read with
+        their own pooled sessions (committed data only), since one AsyncSession
+        can't run queries concurrently. Signal quality is an ORM row updated
+        through the caller's session, so it is fetched with that session.
+        """
+        key = (symbol, direction, webhook_source)
+        baseline_stats = self._fresh_baseline_stats(key)
+
+        lookups = [self._get_signal_quality(db, symbol, direction, webhook_source)]
+        if baseline_stats is None:
+            lookups.append(self._in_own_session(self._get_baseline_stats, symbol, direction, webhook_source))
+        if include_strategies:
+            lookups.append(self._in_own_session(self._get_all_strategies, symbol, direction, webhook_source))
+
+        results = await asyncio.gather(*lookups)
+
+        signal_quality = results[0]
+        if baseline_stats is None:
+            baseline_stats = results[1]
+            self._baseline_cache[key] = (time.monotonic(), baseline_stats)
+
+        return PhaseContext(
+            baseline_stats=baseline_stats,
+            signal_quality=signal_quality,
+            strategies=results[-1] if include_strategies else None
+        )
+
+    @staticmethod
+    async def _in_own_session(fetch, *args):
+        """Run a read-only fetch on a dedicated pooled session"""
+        async with AsyncSessionLocal() as session:
+            return await fetch(session, *args)
+
+    def _fresh_baseline_stats(self, key: Tuple[str, str, str]) -> Optional[Dict]:
+        """Cached baseline stats for a signal, or None if missing/expired"""
+        cached = self._baseline_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.BASELINE_CACHE_TTL:
+            return cached[1]
+        return None
+
+    async def _get_cached_baseline_stats(
+        self,
+        db: AsyncSession,
+        symbol: str,
+        direction: str,
+        webhook_source: str
+    ) -> Dict:
+        """Baseline stats through the short-lived cache, queried on the caller's session"""
+        key = (symbol, direction, webhook_source)
+        baseline_stats = self._fresh_baseline_stats(key)
+        if baseline_stats is None:
+            baseline_stats = await self._get_baseline_stats(db, symbol, direction, webhook_source)
+            self._baseline_cache[key] = (time.monotonic(), baseline_stats)
+        return baseline_stats
+
+    def invalidate_baseline_cache(self, symbol: str, direction: str, webhook_source: str):
+        """Drop cached baseline stats, e.g. right after a baseline trade completes"""
+        self._baseline_cache.pop((symbol, direction, webhook_source), None)
 
     async def _evaluate_phase_i(
         self,
@@ -163,14 +327,11 @@ class PhaseManager:
                     signal_quality.early_detection_status = 'poor'
                     signal_quality.recommendation = 'SKIP_OPTIMIZATION'
 
-                return TradePhaseInfo(
-                    phase='I',
-                    phase_name='Poor Signal - Skipped',
-                    baseline_completed=baseline_count,
-                    baseline_needed=0,
-                    best_strategy=None,
-                    description=f'Signal quality too low (WR={win_rate:.1f}%). Optimization skipped.'
-                )
+                return {
+                    **_POOR_SIGNAL_INFO,
+                    'baseline_completed': baseline_count,
+                    'description': f'Signal quality too low (WR={win_rate:.1f}%). Optimization skipped.'
+                }
 
             # Check for statistically significant evidence of <50% WR
             if signal_quality and signal_quality.is_significant:
@@ -183,14 +344,11 @@ class PhaseManager:
                     signal_quality.early_detection_status = 'poor'
                     signal_quality.recommendation = 'SKIP_OPTIMIZATION'
 
-                    return TradePhaseInfo(
-                        phase='I',
-                        phase_name='Poor Signal - Skipped',
-                        baseline_completed=baseline_count,
-                        baseline_needed=0,
-                        best_strategy=None,
-                        description=f'Statistically poor signal (CI: {signal_quality.ci_lower:.1f}-{signal_quality.ci_upper:.1f}%)'
-                    )
+                    return {
+                        **_POOR_SIGNAL_INFO,
+                        'baseline_completed': baseline_count,
+                        'description': f'Statistically poor signal (CI: {signal_quality.ci_lower:.1f}-{signal_quality.ci_upper:.1f}%)'
+                    }
 
         # 2. Check for exceptional signal (fast-track)
         if baseline_count >= 20:  # Minimum for fast-track
@@ -206,8 +364,8 @@ class PhaseManager:
                 if signal_quality:
                     signal_quality.early_detection_status = 'exceptional'
                     signal_quality.high_wr_potential = True
-                    signal_quality.phase2_predicted_wr = Decimal(str(min(win_rate + 5, 85)))
-                    signal_quality.phase2_confidence = Decimal(str(85.0))
+                    signal_quality.phase2_predicted_wr = Decimal(min(win_rate + 5, 85)).quantize(_TWO_PLACES)
+                    signal_quality.phase2_confidence = _FAST_TRACK_CONFIDENCE
 
                 # Trigger Phase II immediately
                 return None  # Will proceed to Phase II check
@@ -252,117 +410,102 @@ class PhaseManager:
         self,
         db: AsyncSession,
         strategy_performance: StrategyPerformance
-    ) -> Tuple[bool, Dict[str, any]]:
+    ) -> Tuple[bool, EligibilityCriteria]:
         """
         Check if strategy meets Phase III promotion criteria
 
         Enhanced for high-WR mode with additional validation
         """
-        criteria = {
-            'eligible': False,
-            'win_rate': float(strategy_performance.win_rate) if strategy_performance.win_rate else 0,
-            'risk_reward': float(strategy_performance.risk_reward) if strategy_performance.risk_reward else 0,
-            'expected_value': 0,
-            'duration': float(strategy_performance.avg_duration_hours) if strategy_performance.avg_duration_hours else 0,
-            'has_valid_sl': False,
-            'meets_wr': False,
-            'meets_rr': False,
-            'meets_ev': False,
-            'meets_duration': False,
-            'sl_tp_constraint': False,
-            'actual_rr_verified': False
-        }
+        sp = strategy_performance
+        criteria = EligibilityCriteria(
+            win_rate=float(sp.win_rate) if sp.win_rate else 0,
+            risk_reward=float(sp.risk_reward) if sp.risk_reward else 0,
+            duration=float(sp.avg_duration_hours) if sp.avg_duration_hours else 0
+        )
 
-        # Basic checks
-        if not strategy_performance.trades_analyzed or strategy_performance.trades_analyzed < 10:
-            criteria['reason'] = 'Insufficient trades analyzed'
+        def fail(reason: str) -> Tuple[bool, EligibilityCriteria]:
+            criteria.reason = reason
             return False, criteria
 
+        # Cheapest checks first; each Decimal column is converted once
+        if not sp.trades_analyzed or sp.trades_analyzed < 10:
+            return fail('Insufficient trades analyzed')
+
         # Check for valid SL (not 999999)
-        if strategy_performance.current_sl_pct and abs(float(strategy_performance.current_sl_pct)) < 100:
-            criteria['has_valid_sl'] = True
+        sl_pct = abs(float(sp.current_sl_pct)) if sp.current_sl_pct else 0
+        if sl_pct and sl_pct < 100:
+            criteria.has_valid_sl = True
         else:
-            criteria['reason'] = 'Invalid or missing stop loss'
-            return False, criteria
+            return fail('Invalid or missing stop loss')
 
         # Duration check
-        if strategy_performance.max_duration_hours and float(strategy_performance.max_duration_hours) <= 24:
-            criteria['meets_duration'] = True
+        max_duration = float(sp.max_duration_hours) if sp.max_duration_hours else 0
+        if max_duration and max_duration <= 24:
+            criteria.meets_duration = True
         else:
-            criteria['reason'] = f"Duration too long: {float(strategy_performance.max_duration_hours):.1f}h > 24h"
-            return False, criteria
+            return fail(f"Duration too long: {max_duration:.1f}h > 24h")
 
-        # Calculate expected value
-        win_rate = criteria['win_rate']
-        risk_reward = criteria['risk_reward']
-        criteria['expected_value'] = self.config.calculate_expected_value(win_rate, risk_reward)
+        win_rate = criteria.win_rate
+        risk_reward = criteria.risk_reward
 
         # HIGH-WR MODE CHECKS
         if self.config.OPTIMIZE_FOR_WIN_RATE:
             # Win rate requirement
             if win_rate >= self.config.PHASE_III_TARGET_WIN_RATE:  # 65%
-                criteria['meets_wr'] = True
+                criteria.meets_wr = True
             else:
-                criteria['reason'] = f"Win rate {win_rate:.1f}% < {self.config.PHASE_III_TARGET_WIN_RATE}%"
-                return False, criteria
+                return fail(f"Win rate {win_rate:.1f}% < {self.config.PHASE_III_TARGET_WIN_RATE}%")
 
             # Expected value requirement
-            if criteria['expected_value'] >= self.config.PHASE_III_MIN_EXPECTED_VALUE:  # 0.05
-                criteria['meets_ev'] = True
+            criteria.expected_value = self.config.calculate_expected_value(win_rate, risk_reward)
+            if criteria.expected_value >= self.config.PHASE_III_MIN_EXPECTED_VALUE:  # 0.05
+                criteria.meets_ev = True
             else:
-                criteria['reason'] = f"Expected value {criteria['expected_value']:.4f} < {self.config.PHASE_III_MIN_EXPECTED_VALUE}"
-                return False, criteria
+                return fail(f"Expected value {criteria.expected_value:.4f} < {self.config.PHASE_III_MIN_EXPECTED_VALUE}")
 
             # Risk/Reward requirement (keep at 1.0 minimum)
             min_rr = 1.0  # As specified in requirements
             if risk_reward >= min_rr:
-                criteria['meets_rr'] = True
+                criteria.meets_rr = True
             else:
-                criteria['reason'] = f"Risk/Reward {risk_reward:.2f} < {min_rr}"
-                return False, criteria
+                return fail(f"Risk/Reward {risk_reward:.2f} < {min_rr}")
 
             # SL < TP constraint check
-            tp_pct = float(strategy_performance.current_tp1_pct) if strategy_performance.current_tp1_pct else 0
-            sl_pct = abs(float(strategy_performance.current_sl_pct)) if strategy_performance.current_sl_pct else 0
-
+            tp_pct = float(sp.current_tp1_pct) if sp.current_tp1_pct else 0
             if sl_pct < tp_pct:
-                criteria['sl_tp_constraint'] = True
+                criteria.sl_tp_constraint = True
             else:
-                criteria['reason'] = f"SL ({sl_pct:.2f}%) must be < TP ({tp_pct:.2f}%)"
-                return False, criteria
+                return fail(f"SL ({sl_pct:.2f}%) must be < TP ({tp_pct:.2f}%)")
 
-            # Verify RR from actual trades (not just planned parameters)
-            criteria['actual_rr_verified'] = await self._verify_actual_rr(
-                db, strategy_performance, min_rr
-            )
+            # Verify RR from actual trades (not just planned parameters) - may
+            # hit the database for rows without actual_rr_20, so it runs last
+            criteria.actual_rr_verified = await self._verify_actual_rr(db, sp, min_rr)
 
-            if not criteria['actual_rr_verified']:
-                criteria['reason'] = f"Actual RR from trades doesn't meet {min_rr} requirement"
-                return False, criteria
+            if not criteria.actual_rr_verified:
+                return fail(f"Actual RR from trades doesn't meet {min_rr} requirement")
 
         else:
             # BALANCED MODE CHECKS (original logic)
             # Win rate requirement (lower threshold)
             if win_rate >= self.config.PHASE_III_MIN_WIN_RATE:  # 45%
-                criteria['meets_wr'] = True
+                criteria.meets_wr = True
 
             # Risk/Reward requirement
             if risk_reward >= self.config.PHASE_III_MIN_RR:  # 1.0
-                criteria['meets_rr'] = True
+                criteria.meets_rr = True
             else:
-                criteria['reason'] = f"Risk/Reward {risk_reward:.2f} < {self.config.PHASE_III_MIN_RR}"
-                return False, criteria
+                return fail(f"Risk/Reward {risk_reward:.2f} < {self.config.PHASE_III_MIN_RR}")
 
             # Expected value requirement
-            if criteria['expected_value'] >= self.config.PHASE_III_MIN_EXPECTED_VALUE:  # 0.02
-                criteria['meets_ev'] = True
+            criteria.expected_value = self.config.calculate_expected_value(win_rate, risk_reward)
+            if criteria.expected_value >= self.config.PHASE_III_MIN_EXPECTED_VALUE:  # 0.02
+                criteria.meets_ev = True
             else:
-                criteria['reason'] = f"Expected value {criteria['expected_value']:.4f} < {self.config.PHASE_III_MIN_EXPECTED_VALUE}"
-                return False, criteria
+                return fail(f"Expected value {criteria.expected_value:.4f} < {self.config.PHASE_III_MIN_EXPECTED_VALUE}")
 
         # All criteria met
-        criteria['eligible'] = True
-        criteria['reason'] = 'All Phase III criteria met'
+        criteria.eligible = True
+        criteria.reason = 'All Phase III criteria met'
 
         return True, criteria
 
@@ -374,38 +517,48 @@ class PhaseManager:
     ) -> bool:
         """
         Verify RR ratio from actual simulated trades, not just parameters
+
+        Reads actual_rr_20, maintained by StrategySimulator.update_strategy_performance.
+        Only rows it has not written yet (NULL) fall back to the aggregate query.
         """
-        # Get recent simulations for this strategy
+        if strategy_performance.actual_rr_20 is not None:
+            return float(strategy_performance.actual_rr_20) >= min_rr
+
+        # Recent simulations for this strategy (averaged in SQL below)
+        recent = select(
+            StrategySimulation.simulated_pnl_pct.label('pnl')
+        ).join(
+            TradeSetup,
+            StrategySimulation.trade_setup_id == TradeSetup.id
+        ).where(
+            and_(
+                TradeSetup.symbol == strategy_performance.symbol,
+                TradeSetup.direction == strategy_performance.direction,
+                TradeSetup.webhook_source == strategy_performance.webhook_source,
+                StrategySimulation.strategy_name == strategy_performance.strategy_name,
+                StrategySimulation.simulated_pnl_pct.isnot(None)
+            )
+        ).order_by(
+            StrategySimulation.created_at.desc()
+        ).limit(20).subquery()
+
         result = await db.execute(
-            select(StrategySimulation).join(
-                TradeSetup,
-                StrategySimulation.trade_setup_id == TradeSetup.id
-            ).where(
-                and_(
-                    TradeSetup.symbol == strategy_performance.symbol,
-                    TradeSetup.direction == strategy_performance.direction,
-                    TradeSetup.webhook_source == strategy_performance.webhook_source,
-                    StrategySimulation.strategy_name == strategy_performance.strategy_name,
-                    StrategySimulation.simulated_pnl_pct.isnot(None)
-                )
-            ).order_by(
-                StrategySimulation.created_at.desc()
-            ).limit(20)
+            select(
+                func.count().label('trades'),
+                cast(func.avg(recent.c.pnl).filter(recent.c.pnl > 0), Float).label('avg_win'),
+                cast(func.avg(-recent.c.pnl).filter(recent.c.pnl < 0), Float).label('avg_loss')
+            )
         )
-        simulations = result.scalars().all()
+        row = result.one()
 
-        if not simulations or len(simulations) < 10:
+        if row.trades < 10:
             return False  # Not enough data
 
-        # Calculate actual RR from trades
-        wins = [float(s.simulated_pnl_pct) for s in simulations if float(s.simulated_pnl_pct) > 0]
-        losses = [abs(float(s.simulated_pnl_pct)) for s in simulations if float(s.simulated_pnl_pct) < 0]
-
-        if not wins or not losses:
+        if row.avg_win is None or row.avg_loss is None:
             return False  # Need both wins and losses
 
-        avg_win = np.mean(wins)
-        avg_loss = np.mean(losses)
+        avg_win = row.avg_win
+        avg_loss = row.avg_loss
 
         if avg_loss == 0:
             return True  # No losses means infinite RR
@@ -423,21 +576,36 @@ class PhaseManager:
     ) -> Dict:
         """
         Get comprehensive baseline statistics
+
+        Aggregated in one query - no per-trade rows are loaded.
         """
-        # Get completed baseline trades
+        filters = (
+            BaselineTrade.symbol == symbol,
+            BaselineTrade.direction == direction,
+            BaselineTrade.webhook_source == webhook_source,
+            BaselineTrade.status == 'completed'
+        )
+
+        # Last 10 completed trades, for the recent trend
+        recent = select(BaselineTrade.final_pnl_pct.label('pnl')).where(
+            *filters
+        ).order_by(BaselineTrade.exit_timestamp.desc()).limit(10).subquery()
+
         result = await db.execute(
-            select(BaselineTrade).where(
-                and_(
-                    BaselineTrade.symbol == symbol,
-                    BaselineTrade.direction == direction,
-                    BaselineTrade.webhook_source == webhook_source,
-                    BaselineTrade.status == 'completed'
-                )
-            ).order_by(BaselineTrade.exit_timestamp.desc())
+            select(
+                func.count().label('completed_count'),
+                func.count().filter(BaselineTrade.final_pnl_pct > 0).label('wins'),
+                cast(func.avg(BaselineTrade.final_pnl_pct), Float).label('avg_pnl'),
+                select(func.count()).select_from(recent).scalar_subquery().label('recent_count'),
+                select(func.count()).select_from(recent).where(
+                    recent.c.pnl > 0
+                ).scalar_subquery().label('recent_wins')
+            ).where(*filters)
         )
-        trades = result.scalars().all()
+        row = result.one()
+        completed_count = row.completed_count
 
-        if not trades:
+        if not completed_count:
             return {
                 'completed_count': 0,
                 'win_rate': 0,
@@ -449,20 +617,17 @@ class PhaseManager:
             }
 
         # Calculate statistics
-        pnls = [float(t.final_pnl_pct) for t in trades]
-        wins = sum(1 for pnl in pnls if pnl > 0)
-        win_rate = (wins / len(trades)) * 100 if trades else 0
+        wins = row.wins
+        win_rate = (wins / completed_count) * 100
 
         # Calculate confidence interval
-        if len(trades) >= 10:
-            ci_lower, ci_upper = self._calculate_confidence_interval(wins, len(trades))
+        if completed_count >= 10:
+            ci_lower, ci_upper = self._calculate_confidence_interval(wins, completed_count)
         else:
             ci_lower, ci_upper = 0, 100
 
         # Recent trend (last 10 trades)
-        recent_trades = trades[:10]
-        recent_wins = sum(1 for t in recent_trades if float(t.final_pnl_pct) > 0)
-        recent_wr = (recent_wins / len(recent_trades)) * 100 if recent_trades else 0
+        recent_wr = (row.recent_wins / row.recent_count) * 100 if row.recent_count else 0
 
         if recent_wr > win_rate + 10:
             recent_trend = 'improving'
@@ -472,9 +637,9 @@ class PhaseManager:
             recent_trend = 'stable'
 
         return {
-            'completed_count': len(trades),
+            'completed_count': completed_count,
             'win_rate': win_rate,
-            'avg_pnl': np.mean(pnls) if pnls else 0,
+            'avg_pnl': row.avg_pnl if row.avg_pnl is not None else 0,
             'ci_lower': ci_lower,
             'ci_upper': ci_upper,
             'ci_width': ci_upper - ci_lower,
@@ -491,16 +656,35 @@ class PhaseManager:
     ) -> Optional[SignalQuality]:
         """
         Get signal quality assessment
+
+        (symbol, direction, webhook_source) is unique (ix_signal_combo), so a row
+        already loaded in this session is returned from the identity map without
+        a query - the same object a query would hand back.
         """
-        result = await db.execute(
-            select(SignalQuality).where(
+        for obj in db.identity_map.values():
+            if type(obj) is not SignalQuality:
+                continue
+            state = inspect(obj)
+            # Expired attributes would lazy-load (not allowed under async)
+            if state.expired_attributes or state.deleted:
+                continue
+            if (
+                obj.symbol == symbol
+                and obj.direction == direction
+                and obj.webhook_source == webhook_source
+            ):
+                return obj
+
+        # lambda_stmt: statement built and cached once, arguments become bound params
+        result = await db.execute(lambda_stmt(
+            lambda: select(SignalQuality).where(
                 and_(
                     SignalQuality.symbol == symbol,
                     SignalQuality.direction == direction,
                     SignalQuality.webhook_source == webhook_source
                 )
             )
-        )
+        ))
         return result.scalar_one_or_none()
 
     async def _get_best_eligible_strategy(
@@ -512,29 +696,32 @@ class PhaseManager:
     ) -> Optional[StrategyConfig]:
         """
         Get the best strategy that meets Phase III criteria
+
+        The column-level criteria are applied in SQL so only candidates are
+        loaded; each candidate still gets the full check (which verifies the
+        actual RR with a query of its own), best score first.
         """
-        # Get all strategies ordered by score
         result = await db.execute(
             select(StrategyPerformance).where(
                 and_(
                     StrategyPerformance.symbol == symbol,
                     StrategyPerformance.direction == direction,
                     StrategyPerformance.webhook_source == webhook_source,
-                    StrategyPerformance.trades_analyzed >= 10
+                    *self._phase_iii_prefilter()
                 )
             ).order_by(StrategyPerformance.strategy_score.desc())
         )
         performances = result.scalars().all()
 
-        # Check each strategy for Phase III eligibility
+        # Check each candidate for Phase III eligibility
         for perf in performances:
             eligible, criteria = await self.check_phase_iii_eligibility(db, perf)
 
             if eligible:
                 logger.info(
                     f"✅ Phase III eligible strategy found: {perf.strategy_name} "
-                    f"WR={criteria['win_rate']:.1f}% RR={criteria['risk_reward']:.2f} "
-                    f"EV={criteria['expected_value']:.4f}"
+                    f"WR={criteria.win_rate:.1f}% RR={criteria.risk_reward:.2f} "
+                    f"EV={criteria.expected_value:.4f}"
                 )
 
                 return StrategyConfig(
@@ -547,33 +734,90 @@ class PhaseManager:
                     trailing_activation=float(perf.current_trailing_activation) if perf.current_trailing_activation else None,
                     trailing_distance=float(perf.current_trailing_distance) if perf.current_trailing_distance else None,
                     # Include metrics for transparency
-                    win_rate=criteria['win_rate'],
-                    risk_reward=criteria['risk_reward'],
-                    expected_value=criteria['expected_value']
+                    win_rate=criteria.win_rate,
+                    risk_reward=criteria.risk_reward,
+                    expected_value=criteria.expected_value
                 )
 
         return None
 
+    def _phase_iii_prefilter(self) -> List:
+        """
+        SQL conditions every Phase III eligible strategy satisfies
+
+        A superset filter of check_phase_iii_eligibility - it may let through
+        strategies the full check rejects, never the reverse. Expected value is
+        left to the full check so float/numeric rounding can't exclude a
+        borderline strategy.
+        """
+        conditions = [
+            StrategyPerformance.trades_analyzed >= 10,
+            StrategyPerformance.current_sl_pct != 0,
+            func.abs(StrategyPerformance.current_sl_pct) < 100,
+            StrategyPerformance.max_duration_hours != 0,
+            StrategyPerformance.max_duration_hours <= 24
+        ]
+
+        if self.config.OPTIMIZE_FOR_WIN_RATE:
+            conditions += [
+                StrategyPerformance.win_rate >= self.config.PHASE_III_TARGET_WIN_RATE,
+                StrategyPerformance.risk_reward >= 1.0,
+                func.abs(StrategyPerformance.current_sl_pct) < StrategyPerformance.current_tp1_pct
+            ]
+        else:
+            conditions.append(StrategyPerformance.risk_reward >= self.config.PHASE_III_MIN_RR)
+
+        return conditions
+
     async def _get_all_strategies(
         self,
         db: AsyncSession,
         symbol: str,
         direction: str,
         webhook_source: str
-    ) -> List[StrategyPerformance]:
+    ) -> List[Row]:
         """
         Get all strategies for a symbol/direction/webhook
+
+        Returns plain rows with only the summary columns - no ORM instances.
+        Numeric columns are cast to float in SQL, so no Decimal is built.
         """
-        result = await db.execute(
-            select(StrategyPerformance).where(
+        result = await db.execute(lambda_stmt(
+            lambda: select(
+                StrategyPerformance.strategy_name,
+                cast(StrategyPerformance.strategy_score, Float).label('strategy_score'),
+                cast(StrategyPerformance.win_rate, Float).label('win_rate'),
+                cast(StrategyPerformance.risk_reward, Float).label('risk_reward'),
+                StrategyPerformance.is_eligible_for_phase3
+            ).where(
                 and_(
                     StrategyPerformance.symbol == symbol,
                     StrategyPerformance.direction == direction,
                     StrategyPerformance.webhook_source == webhook_source
                 )
             ).order_by(StrategyPerformance.strategy_score.desc())
-        )
-        return result.scalars().all()
+        ))
+        return result.all()
+
+    async def _count_strategies(
+        self,
+        db: AsyncSession,
+        symbol: str,
+        direction: str,
+        webhook_source: str
+    ) -> int:
+        """
+        Count strategies for a symbol/direction/webhook without loading them
+        """
+        return await db.scalar(lambda_stmt(
+            lambda: select(func.count()).select_from(StrategyPerformance).where(
+                and_(
+                    StrategyPerformance.symbol == symbol,
+                    StrategyPerformance.direction == direction,
+                    StrategyPerformance.webhook_source == webhook_source
+                )
+            )
+        ))
 
     def _calculate_confidence_interval(
         self,
@@ -587,17 +831,7 @@ class PhaseManager:
         if trials == 0:
             return 0, 0
 
-        p_hat = successes / trials
-        z = stats.norm.ppf((1 + confidence) / 2)
-
-        denominator = 1 + z**2 / trials
-        center = (p_hat + z**2 / (2 * trials)) / denominator
-        spread = z * np.sqrt((p_hat * (1 - p_hat) / trials + z**2 / (4 * trials**2))) / denominator
-
-        ci_lower = max(0, (center - spread) * 100)
-        ci_upper = min(100, (center + spread) * 100)
-
-        return ci_lower, ci_upper
+        return _wilson_interval(successes, trials, confidence)
 
     async def update_strategy_eligibility(
         self,
@@ -611,18 +845,85 @@ class PhaseManager:
 
         # Update the strategy performance record
         strategy_performance.is_eligible_for_phase3 = eligible
-        strategy_performance.meets_rr_requirement = criteria.get('meets_rr', False)
-        strategy_performance.has_real_sl = criteria.get('has_valid_sl', False)
-        strategy_performance.meets_duration_requirement = criteria.get('meets_duration', False)
+        strategy_performance.meets_rr_requirement = criteria.meets_rr
+        strategy_performance.has_real_sl = criteria.has_valid_sl
+        strategy_performance.meets_duration_requirement = criteria.meets_duration
 
         # Log the update
         logger.info(
             f"📊 Updated {strategy_performance.strategy_name} eligibility: "
-            f"{'✅ ELIGIBLE' if eligible else '❌ NOT ELIGIBLE'} - {criteria.get('reason', '')}"
+            f"{'✅ ELIGIBLE' if eligible else '❌ NOT ELIGIBLE'} - {criteria.reason}"
         )
 
         return eligible
 
+    async def bulk_update_eligibility(
+        self,
+        db: AsyncSession,
+        symbol: str,
+        direction: str,
+        webhook_source: str
+    ) -> int:
+        """
+        Refresh Phase III eligibility for every strategy of a signal
+
+        One UPDATE sets the column-derived flags (and clears eligibility) for all
+        strategies; only candidates passing _phase_iii_prefilter then get the
+        full check, which needs the actual-RR query.
+
+        Returns:
+            Number of eligible strategies
+        """
+        sp = StrategyPerformance
+        key = (
+            sp.symbol == symbol,
+            sp.direction == direction,
+            sp.webhook_source == webhook_source
+        )
+
+        # Same short-circuit order as check_phase_iii_eligibility
+        has_sl = and_(
+            sp.trades_analyzed >= 10,
+            sp.current_sl_pct != 0,
+            func.abs(sp.current_sl_pct) < 100
+        )
+        meets_duration = and_(has_sl, sp.max_duration_hours != 0, sp.max_duration_hours <= 24)
+        if self.config.OPTIMIZE_FOR_WIN_RATE:
+            expected_value = sp.win_rate / 100.0 * sp.risk_reward - (1 - sp.win_rate / 100.0)
+            meets_rr = and_(
+                meets_duration,
+                sp.win_rate >= self.config.PHASE_III_TARGET_WIN_RATE,
+                expected_value >= self.config.PHASE_III_MIN_EXPECTED_VALUE,
+                sp.risk_reward >= 1.0
+            )
+        else:
+            meets_rr = and_(meets_duration, sp.risk_reward >= self.config.PHASE_III_MIN_RR)
+
+        await db.execute(
+            update(sp).where(*key).values(
+                is_eligible_for_phase3=False,
+                has_real_sl=func.coalesce(has_sl, False),
+                meets_duration_requirement=func.coalesce(meets_duration, False),
+                meets_rr_requirement=func.coalesce(meets_rr, False)
+            )
+        )
+
+        # Full check (incl. actual RR) only where it can succeed
+        result = await db.execute(
+            select(sp).where(*key, *self._phase_iii_prefilter())
+        )
+        eligible_count = 0
+        for perf in result.scalars().all():
+            if await self.update_strategy_eligibility(db, perf):
+                eligible_count += 1
+
+        logger.info(
+            f"📊 Refreshed eligibility for {symbol} {direction} ({webhook_source}): "
+            f"{eligible_count} eligible"
+        )
+
+        return eligible_count
+
     async def get_phase_summary(
         self,
         db: AsyncSession,
@@ -633,17 +934,17 @@ class PhaseManager:
         """
         Get comprehensive phase summary for monitoring
         """
-        # Get current phase
-        phase_info = await self.determine_phase(db, symbol, direction, webhook_source)
-
-        # Get baseline stats
-        baseline_stats = await self._get_baseline_stats(db, symbol, direction, webhook_source)
+        # Load inputs once (concurrently) and share them with the phase decision
+        context = await self._load_context(
+            db, symbol, direction, webhook_source, include_strategies=True
+        )
 
-        # Get signal quality
-        signal_quality = await self._get_signal_quality(db, symbol, direction, webhook_source)
+        # Get current phase
+        phase_info = await self.determine_phase(db, symbol, direction, webhook_source, context=context)
 
-        # Get all strategies
-        strategies = await self._get_all_strategies(db, symbol, direction, webhook_source)
+        baseline_stats = context.baseline_stats
+        signal_quality = context.signal_quality
+        strategies = context.strategies
 
         # Count Phase III eligible strategies
         eligible_count = sum(1 for s in strategies if s.is_eligible_for_phase3)
@@ -672,9 +973,9 @@ class PhaseManager:
             'strategies': {
                 'total': len(strategies),
                 'phase_iii_eligible': eligible_count,
-                'best_score': float(strategies[0].strategy_score) if strategies else 0,
-                'best_win_rate': float(strategies[0].win_rate) if strategies else 0,
-                'best_rr': float(strategies[0].risk_reward) if strategies else 0
+                'best_score': strategies[0].strategy_score if strategies else 0,
+                'best_win_rate': strategies[0].win_rate if strategies else 0,
+                'best_rr': strategies[0].risk_reward if strategies else 0
             },
             'optimization_mode': 'HIGH_WIN_RATE' if self.config.OPTIMIZE_FOR_WIN_RATE else 'BALANCED'
         }
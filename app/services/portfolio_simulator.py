@@ -6,22 +6,42 @@ Simulates portfolio performance assuming:
 - Risk per trade: 0.1% of current balance (configurable)
 - Leverage already factored into PnL%
 """
-from typing import List, Dict
-from sqlalchemy import select
+from itertools import groupby
+from operator import itemgetter
+from typing import List, Dict, Tuple
+from sqlalchemy import Float, cast, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.models import TradeSetup
 from app.database.strategy_models import StrategySimulation
 from decimal import Decimal
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+def _max_streaks(pnl: np.ndarray) -> Tuple[int, int]:
+    """
+    Longest win and loss streaks (a trade with pnl <= 0 counts as a loss)
+
+    Run-length encodes the win/loss sign array instead of walking it per trade.
+    """
+    sign = np.where(pnl > 0, 1, -1).astype(np.int8)
+    change_idx = np.flatnonzero(np.diff(sign)) + 1
+    run_lens = np.diff(np.concatenate(([0], change_idx, [len(sign)])))
+    run_signs = sign[np.concatenate(([0], change_idx))]
+
+    max_win_streak = int(run_lens[run_signs == 1].max(initial=0))
+    max_loss_streak = int(run_lens[run_signs == -1].max(initial=0))
+    return max_win_streak, max_loss_streak
+
+
 class PortfolioSimulator:
     """Simulate portfolio performance for each strategy"""
     
     DEFAULT_STARTING_CAPITAL = 100000.0  # $100k
     DEFAULT_RISK_PER_TRADE_PCT = 0.1     # 0.1% of balance per trade
+    DEFAULT_CURVE_RESOLUTION = 500       # Max balance curve points per strategy
     
     @classmethod
     async def simulate_portfolio_performance(
@@ -31,7 +51,8 @@ class PortfolioSimulator:
         direction: str = None,
         webhook_source: str = None,
         starting_capital: float = DEFAULT_STARTING_CAPITAL,
-        risk_pct: float = DEFAULT_RISK_PER_TRADE_PCT
+        risk_pct: float = DEFAULT_RISK_PER_TRADE_PCT,
+        curve_resolution: int = DEFAULT_CURVE_RESOLUTION
     ) -> Dict:
         """
         Simulate portfolio performance for all strategies
@@ -43,52 +64,39 @@ class PortfolioSimulator:
             webhook_source: Optional filter by webhook
             starting_capital: Starting balance in USD
             risk_pct: % of balance to risk per trade
+            curve_resolution: Max balance_curve points per strategy (0 = every trade)
             
         Returns:
             Dict with portfolio metrics for each strategy
         """
-        # Build query to get completed trade IDs with simulations in chronological order
-        # Use subquery to avoid DISTINCT on JSON columns
-        subquery = (
-            select(TradeSetup.id.distinct())
+        # One query: strategy and PnL% of every simulation of a completed trade,
+        # sorted per strategy in chronological order (ties by trade id)
+        query = (
+            select(
+                TradeSetup.id,
+                StrategySimulation.strategy_name,
+                cast(StrategySimulation.simulated_pnl_pct, Float)
+            )
             .join(StrategySimulation, TradeSetup.id == StrategySimulation.trade_setup_id)
-            .where(TradeSetup.status == 'completed')
+            .where(
+                TradeSetup.status == 'completed',
+                # Unfinished simulations would count as 0% trades
+                StrategySimulation.simulated_pnl_pct.isnot(None)
+            )
+            .order_by(StrategySimulation.strategy_name, TradeSetup.completed_at, TradeSetup.id)
         )
-        
+
         if symbol:
-            subquery = subquery.where(TradeSetup.symbol == symbol)
+            query = query.where(TradeSetup.symbol == symbol)
         if direction:
-            subquery = subquery.where(TradeSetup.direction == direction)
+            query = query.where(TradeSetup.direction == direction)
         if webhook_source:
-            subquery = subquery.where(TradeSetup.webhook_source == webhook_source)
-            
-        # Get the trade IDs
-        id_result = await db.execute(subquery)
-        trade_ids_set = set(row[0] for row in id_result.all())
-        
-        if not trade_ids_set:
-            return {
-                "strategies": {},
-                "filters": {
-                    "symbol": symbol,
-                    "direction": direction,
-                    "webhook_source": webhook_source,
-                    "starting_capital": starting_capital,
-                    "risk_pct": risk_pct
-                }
-            }
-        
-        # Now get the full trades
-        query = (
-            select(TradeSetup)
-            .where(TradeSetup.id.in_(trade_ids_set))
-            .order_by(TradeSetup.completed_at)
-        )
-        
+            query = query.where(TradeSetup.webhook_source == webhook_source)
+
         result = await db.execute(query)
-        trades = result.scalars().all()
-        
-        if not trades:
+        rows = result.all()
+
+        if not rows:
             return {
                 "strategies": {},
                 "filters": {
@@ -99,125 +107,86 @@ class PortfolioSimulator:
                     "risk_pct": risk_pct
                 }
             }
-        
-        # Get all simulations for these trades
-        trade_ids = [t.id for t in trades]
-        sim_result = await db.execute(
-            select(StrategySimulation)
-            .where(StrategySimulation.trade_setup_id.in_(trade_ids))
-            .order_by(StrategySimulation.trade_setup_id)
-        )
-        all_sims = sim_result.scalars().all()
-        
-        # Group simulations by strategy
-        sims_by_strategy = {}
-        for sim in all_sims:
-            if sim.strategy_name not in sims_by_strategy:
-                sims_by_strategy[sim.strategy_name] = []
-            sims_by_strategy[sim.strategy_name].append(sim)
-        
+
+        trade_ids = {row[0] for row in rows}
+
+        # Both /100 scalings of the P&L formula, folded into one constant
+        risk_factor = risk_pct * 1e-4
+
         # Simulate portfolio for each strategy
         portfolio_results = {}
-        
-        for strategy_name, sims in sims_by_strategy.items():
-            # Sort by trade completion time
-            sims_with_time = []
-            for sim in sims:
-                # Find the trade
-                trade = next((t for t in trades if t.id == sim.trade_setup_id), None)
-                if trade:
-                    sims_with_time.append((trade.completed_at, sim))
-            
-            sims_with_time.sort(key=lambda x: x[0])
-            
-            # Simulate portfolio
-            balance = starting_capital
-            balance_curve = [{"trade": 0, "balance": balance, "balance_pct": 100.0}]
-            max_balance = balance
-            min_balance = balance
-            
-            current_streak = 0
-            max_win_streak = 0
-            max_loss_streak = 0
-            
-            wins = 0
-            losses = 0
-            total_pnl_usd = 0
-            
-            for i, (completed_at, sim) in enumerate(sims_with_time, 1):
-                pnl_pct = float(sim.simulated_pnl_pct or 0)
-                
-                # Calculate position size based on current balance and risk%
-                # Risk per trade = balance * (risk_pct / 100)
-                # With leverage, the actual P&L is: risk_amount * (pnl_pct / 100)
-                risk_amount = balance * (risk_pct / 100.0)
-                pnl_usd = risk_amount * (pnl_pct / 100.0)
-                
-                # Update balance
-                balance += pnl_usd
-                total_pnl_usd += pnl_usd
-                
-                # Track min/max
-                max_balance = max(max_balance, balance)
-                min_balance = min(min_balance, balance)
-                
-                # Track streaks
-                if pnl_pct > 0:
-                    wins += 1
-                    if current_streak >= 0:
-                        current_streak += 1
-                    else:
-                        current_streak = 1
-                    max_win_streak = max(max_win_streak, current_streak)
-                else:
-                    losses += 1
-                    if current_streak <= 0:
-                        current_streak -= 1
-                    else:
-                        current_streak = -1
-                    max_loss_streak = max(max_loss_streak, abs(current_streak))
-                
-                # Record balance snapshot
-                balance_pct = (balance / starting_capital) * 100.0
-                balance_curve.append({
-                    "trade": i,
-                    "balance": round(balance, 2),
-                    "balance_pct": round(balance_pct, 2),
-                    "pnl_usd": round(pnl_usd, 2),
-                    "pnl_pct": round(pnl_pct, 2)
-                })
+        best_strategy, best_return_pct = None, float('-inf')
+
+        # Rows arrive grouped by strategy, so consecutive runs are the groups
+        for strategy_name, group in groupby(rows, key=itemgetter(1)):
+            # Per-trade PnL% in completion order
+            pnl = np.fromiter((pnl_pct for _, _, pnl_pct in group), dtype=np.float64)
+            n = len(pnl)
+
+            # Risk per trade = balance * (risk_pct / 100); with leverage the
+            # actual P&L is risk_amount * (pnl_pct / 100), so each trade
+            # multiplies the balance by 1 + risk_factor * pnl_pct
+            growth = 1.0 + risk_factor * pnl
+            balances = starting_capital * np.cumprod(growth)
+            pnl_usd = np.diff(balances, prepend=starting_capital)
+
+            balance = float(balances[-1])
+            total_pnl_usd = balance - starting_capital
+            max_balance = max(starting_capital, float(balances.max()))
+            min_balance = min(starting_capital, float(balances.min()))
+
+            wins = int((pnl > 0).sum())
+            losses = n - wins
+
+            max_win_streak, max_loss_streak = _max_streaks(pnl)
+
+            # Balance snapshots, downsampled to at most curve_resolution evenly
+            # spaced trades (always keeping the last) and built only for those
+            if curve_resolution and n > curve_resolution:
+                idx = np.unique(np.linspace(0, n - 1, curve_resolution).astype(np.int64))
+            else:
+                idx = np.arange(n)
+            kept_balances = balances[idx]
+
+            # Columnar: one list per field, index 0 is the starting point
+            balance_curve = {
+                "trade": [0] + (idx + 1).tolist(),
+                "balance": [starting_capital] + np.round(kept_balances, 2).tolist(),
+                "balance_pct": [100.0] + np.round(kept_balances / starting_capital * 100.0, 2).tolist(),
+                "pnl_usd": [0.0] + np.round(pnl_usd[idx], 2).tolist(),
+                "pnl_pct": [0.0] + np.round(pnl[idx], 2).tolist()
+            }
             
             # Calculate final metrics
             total_return_pct = ((balance - starting_capital) / starting_capital) * 100.0
             max_drawdown_pct = ((max_balance - min_balance) / max_balance) * 100.0 if max_balance > 0 else 0
-            win_rate = (wins / len(sims_with_time)) * 100.0 if sims_with_time else 0
-            
+            win_rate = (wins / n) * 100.0
+
+            # Track best strategy by total return % (first one wins ties)
+            total_return_pct = round(total_return_pct, 2)
+            if total_return_pct > best_return_pct:
+                best_strategy, best_return_pct = strategy_name, total_return_pct
+
             portfolio_results[strategy_name] = {
                 "starting_capital": starting_capital,
                 "final_balance": round(balance, 2),
                 "total_return_usd": round(total_pnl_usd, 2),
-                "total_return_pct": round(total_return_pct, 2),
+                "total_return_pct": total_return_pct,
                 "max_balance": round(max_balance, 2),
                 "min_balance": round(min_balance, 2),
                 "max_drawdown_pct": round(max_drawdown_pct, 2),
                 "win_rate": round(win_rate, 2),
                 "wins": wins,
                 "losses": losses,
-                "total_trades": len(sims_with_time),
+                "total_trades": n,
                 "max_win_streak": max_win_streak,
                 "max_loss_streak": max_loss_streak,
                 "balance_curve": balance_curve
             }
-        
-        # Find best strategy by total return %
-        best_strategy = max(
-            portfolio_results.items(),
-            key=lambda x: x[1]['total_return_pct']
-        ) if portfolio_results else None
-        
+
         return {
             "strategies": portfolio_results,
-            "best_strategy": best_strategy[0] if best_strategy else None,
+            "best_strategy": best_strategy,
             "filters": {
                 "symbol": symbol,
                 "direction": direction,
@@ -226,7 +195,7 @@ class PortfolioSimulator:
                 "risk_pct": risk_pct
             },
             "summary": {
-                "total_unique_trades": len(trades),
+                "total_unique_trades": len(trade_ids),
                 "strategies_compared": len(portfolio_results)
             }
         }
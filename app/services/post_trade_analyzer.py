@@ -8,15 +8,23 @@ Handles post-trade operations:
 4. Strategy simulation
 5. Price sample cleanup
 """
-from datetime import datetime
 from decimal import Decimal
+from typing import List
 import logging
 
-from app.database.models import TradeSetup, TradePriceSample
+from app.database.models import AssetStatistics, TradeSetup, TradePriceSample
+from app.services.ai_analyzer import get_analyzer
+from app.services.statistics_engine import StatisticsEngine
+from app.services.strategy_simulator import StrategySimulator
+from sqlalchemy import and_, case, delete, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+# PnL is bound into SQL as an exact Decimal; built from the float directly
+# (no str round trip) and trimmed to 8 places
+_PNL_PLACES = Decimal('0.00000001')
+
 
 class PostTradeAnalyzer:
     """
@@ -30,6 +38,10 @@ class PostTradeAnalyzer:
     - Price sample cleanup (delete to keep DB small)
     """
 
+    def __init__(self):
+        """Initialize the analyzer (one instance per price tracker)"""
+        self.stats_engine = StatisticsEngine()
+
     async def analyze_trade(self, trade: TradeSetup, outcome: str, final_pnl: float, db: AsyncSession):
         """
         Run AI analysis on completed trade
@@ -37,7 +49,6 @@ class PostTradeAnalyzer:
         Analyzes WHY the trade won/lost to build knowledge base
         """
         try:
-            from app.services.ai_analyzer import get_analyzer
             analyzer = get_analyzer()
 
             ai_insights = await analyzer.analyze_trade_outcome(
@@ -69,7 +80,6 @@ class PostTradeAnalyzer:
 
         Enables fair comparison between strategies using same market conditions
         """
-        from app.services.strategy_simulator import StrategySimulator
         try:
             await StrategySimulator.simulate_all_strategies_for_trade(trade, db)
         except Exception as e:
@@ -86,53 +96,67 @@ class PostTradeAnalyzer:
         4. Determine live trading eligibility
         5. Recalculate all asset statistics
         """
-        from app.services.statistics_engine import StatisticsEngine
-        stats_engine = StatisticsEngine()
-        stats = await stats_engine.get_asset_statistics(trade.symbol, db)
+        # Update cumulative wins/losses, R/R and live trading eligibility in one
+        # statement (SET expressions all see the old row values)
+        pnl_usd = Decimal(final_pnl).copy_abs().quantize(_PNL_PLACES)
+        wins_usd = func.coalesce(AssetStatistics.cumulative_wins_usd, 0)
+        losses_usd = func.coalesce(AssetStatistics.cumulative_losses_usd, 0)
+        if final_pnl > 0:
+            wins_usd = wins_usd + pnl_usd
+        else:
+            losses_usd = losses_usd + pnl_usd
+        cumulative_rr = case((losses_usd > 0, wins_usd / losses_usd), else_=wins_usd)
+
+        result = await db.execute(
+            update(AssetStatistics)
+            .where(AssetStatistics.symbol == trade.symbol)
+            .values(
+                cumulative_wins_usd=wins_usd,
+                cumulative_losses_usd=losses_usd,
+                cumulative_rr=cumulative_rr,
+                last_rr_check=func.now(),
+                # Phase 1-2: 20 setups before live trading; Phase 3: R/R >= 1.0
+                is_live_trading=and_(
+                    func.coalesce(AssetStatistics.completed_setups, 0) >= 20,
+                    cumulative_rr >= 1
+                )
+            )
+            .returning(
+                AssetStatistics.cumulative_wins_usd,
+                AssetStatistics.cumulative_losses_usd,
+                AssetStatistics.cumulative_rr,
+                AssetStatistics.completed_setups
+            )
+        )
+        row = result.one_or_none()
 
-        if stats:
-            # Update cumulative wins/losses
+        if row:
             if final_pnl > 0:
-                stats.cumulative_wins_usd = (stats.cumulative_wins_usd or Decimal("0")) + Decimal(str(abs(final_pnl)))
-                logger.info(f"💰 {trade.symbol}: Win +{final_pnl:.2f}% (Total wins: ${stats.cumulative_wins_usd})")
-            else:
-                stats.cumulative_losses_usd = (stats.cumulative_losses_usd or Decimal("0")) + Decimal(str(abs(final_pnl)))
-                logger.info(f"📉 {trade.symbol}: Loss {final_pnl:.2f}% (Total losses: ${stats.cumulative_losses_usd})")
-
-            # Recalculate cumulative R/R
-            if stats.cumulative_losses_usd and stats.cumulative_losses_usd > 0:
-                stats.cumulative_rr = stats.cumulative_wins_usd / stats.cumulative_losses_usd
+                logger.info(f"💰 {trade.symbol}: Win +{final_pnl:.2f}% (Total wins: ${row.cumulative_wins_usd})")
             else:
-                stats.cumulative_rr = stats.cumulative_wins_usd
-
-            stats.last_rr_check = datetime.utcnow()
+                logger.info(f"📉 {trade.symbol}: Loss {final_pnl:.2f}% (Total losses: ${row.cumulative_losses_usd})")
 
-            # Check circuit breaker threshold and live trading eligibility
-            rr = float(stats.cumulative_rr)
-            completed = stats.completed_setups
+            # Circuit breaker / live trading eligibility (already written above)
+            rr = float(row.cumulative_rr)
+            completed = row.completed_setups or 0
 
-            # Phase 1-2: Must complete 20 setups before live trading (10 baseline + 10 optimization)
             if completed < 20:
-                stats.is_live_trading = False
                 logger.info(
                     f"📊 {trade.symbol}: Setup {completed}/20 complete → PAPER MODE (baseline/optimization phase)"
                 )
-            # Phase 3: Check circuit breaker (R/R must be >= 1.0 for live trading)
             elif rr < 1.0:
-                stats.is_live_trading = False
-                deficit = float(stats.cumulative_losses_usd - stats.cumulative_wins_usd)
+                deficit = float(row.cumulative_losses_usd - row.cumulative_wins_usd)
                 logger.warning(
                     f"🚨 CIRCUIT BREAKER TRIGGERED: {trade.symbol} R/R={rr:.4f} < 1.0 "
                     f"(Deficit: ${deficit:.2f}) → PAPER MODE"
                 )
             else:
-                stats.is_live_trading = True
                 logger.info(f"✅ {trade.symbol} R/R: {rr:.4f}, {completed} setups → LIVE MODE")
 
             await db.commit()
 
         # Update asset statistics (trigger recalculation)
-        await stats_engine.update_asset_statistics(trade.symbol, db)
+        await self.stats_engine.update_asset_statistics(trade.symbol, db)
 
     async def cleanup_price_samples(self, trade: TradeSetup, db: AsyncSession):
         """
@@ -141,11 +165,22 @@ class PostTradeAnalyzer:
         Keeps database size small by removing temporary tick data
         Should be called AFTER strategy simulation (which needs the samples)
         """
-        from sqlalchemy import delete
+        await self.cleanup_price_samples_bulk([trade.id], db)
+
+    async def cleanup_price_samples_bulk(self, trade_ids: List[int], db: AsyncSession):
+        """
+        Delete price samples for several completed trades in one statement
+
+        Same rule as cleanup_price_samples: only after their strategy simulations ran.
+        Samples of deleted trades go with them (ON DELETE CASCADE).
+        """
+        if not trade_ids:
+            return
+
         await db.execute(
-            delete(TradePriceSample).where(TradePriceSample.trade_setup_id == trade.id)
+            delete(TradePriceSample).where(TradePriceSample.trade_setup_id.in_(trade_ids))
         )
-        logger.info(f"🗑️ Cleaned up price samples for trade {trade.id}")
+        logger.info(f"🗑️ Cleaned up price samples for {len(trade_ids)} trade(s): {trade_ids}")
         await db.commit()
 
     async def process_completed_trade(
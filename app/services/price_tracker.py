@@ -12,6 +12,7 @@ Performance Optimizations:
 2. Database Commit Batching:
    - Before: 50 trades × 10 ticks/sec = 500 commits/sec ❌ CRASH
    - After: 1 commit/sec ✅ STABLE (500x reduction)
+   - Group commit: 1 background committer writes ALL symbols in one transaction per interval
 
 3. Database Session Pooling (NEW):
    - Before: Creates new AsyncSessionLocal() for EVERY tick (1000+/sec) ❌ OVERHEAD
@@ -26,7 +27,7 @@ Scalability at 500 trades:
 - Fully stable, no crashes
 """
 import asyncio
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 import logging
@@ -44,7 +45,8 @@ from app.services.milestone_recorder import MilestoneRecorder
 from app.services.post_trade_analyzer import PostTradeAnalyzer
 from app.services.metrics import metrics_service
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import inspect, insert, select, func, update
+from sqlalchemy.orm.attributes import flag_modified, set_committed_value
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +77,7 @@ class PriceTracker:
         # Trade tracking
         self.active_trades: Dict[int, TradeSetup] = {}  # trade_id -> TradeSetup
         self.subscriptions: Dict[str, Set[int]] = {}  # symbol -> set of trade_ids
+        self.subscriptions_snapshot: Dict[str, Tuple[int, ...]] = {}  # symbol -> trade_ids, rebuilt on add/remove
         self.running = False
 
         # Database session (required for callbacks)
@@ -85,14 +88,22 @@ class PriceTracker:
 
         # Database batching (CRITICAL for performance at scale)
         # FIXED: Use per-session pending samples to avoid session conflicts
-        self.pending_samples: Dict[str, List[TradePriceSample]] = {}  # symbol -> list of samples
-        self.last_commit_time: Dict[str, float] = {}  # symbol -> last commit time
+        self.pending_samples: List[Dict] = []  # sample rows (all symbols) awaiting the next group commit
+        self.latest_prices: Dict[str, Tuple[float, datetime]] = {}  # symbol -> last processed price (baseline updates)
         self.COMMIT_INTERVAL_SEC = 5.0  # Commit every 5 seconds (80% less DB load vs 1sec)
-        self.commit_locks: Dict[str, asyncio.Lock] = {}  # symbol -> lock
+        self.commit_lock = asyncio.Lock()  # one committer at a time (background loop vs. trade close)
+        self.committer_task: Optional[asyncio.Task] = None
+        self.committer_stop = asyncio.Event()  # wakes the committer for shutdown
+        self.MAX_COMMIT_ATTEMPTS = 3  # a batch failing this often is dropped (one bad row must not block all writes)
+        self.failed_commit_attempts = 0
+
+        # Planned TP1/TP2/TP3 % as floats (fixed at entry - converted once, not per tick)
+        self.tp_levels: Dict[int, Tuple[Optional[float], Optional[float], Optional[float]]] = {}
         
         # Tick rate limiting (CRITICAL for CPU performance)
-        self.last_tick_time: Dict[str, float] = {}  # symbol -> last processed tick time
+        self.next_tick_ns: Dict[str, int] = {}  # symbol -> monotonic deadline for next processed tick
         self.TICK_PROCESS_INTERVAL_SEC = 2.0  # Process ticks every 2 seconds per symbol (60% CPU reduction)
+        self.TICK_PROCESS_INTERVAL_NS = int(self.TICK_PROCESS_INTERVAL_SEC * 1_000_000_000)
 
         # Exit strategy handlers
         self.exit_handlers = {
@@ -117,8 +128,8 @@ class PriceTracker:
         Session Management:
         - Creates a NEW session for each callback invocation to ensure proper async context
         - Sessions are automatically closed after processing to prevent leaks
-        - This is correct behavior - SQLAlchemy async sessions must be created in the same
-          async context where they're used (can't be pooled across contexts)
+        - Ticks for different symbols run concurrently, and an AsyncSession must never be
+          used by two tasks at once (a single-task owner may reuse one - see _committer_loop)
         """
         from app.database.database import AsyncSessionLocal
 
@@ -128,16 +139,12 @@ class PriceTracker:
                 return
             
             # Rate limit: Only process ticks every TICK_PROCESS_INTERVAL_SEC per symbol
-            current_time = time.time()
-            if symbol not in self.last_tick_time:
-                self.last_tick_time[symbol] = 0
-            
-            # Skip if we processed this symbol recently
-            if current_time - self.last_tick_time[symbol] < self.TICK_PROCESS_INTERVAL_SEC:
+            # (monotonic deadline - one int compare, immune to wall-clock jumps)
+            now_ns = time.monotonic_ns()
+            if now_ns < self.next_tick_ns.get(symbol, 0):
                 return  # Throttle: skip this tick
-            
-            # Update last tick time
-            self.last_tick_time[symbol] = current_time
+
+            self.next_tick_ns[symbol] = now_ns + self.TICK_PROCESS_INTERVAL_NS
 
             # Create session in this async context (CRITICAL for SQLAlchemy async)
             # Cannot reuse sessions across async contexts - causes "greenlet_spawn" error
@@ -179,6 +186,9 @@ class PriceTracker:
                 self.websocket_manager.start_health_monitor()
             )
 
+        # Start group committer (one transaction per interval for all symbols)
+        self.start_committer()
+
         # Start timeout checker
         timeout_task = asyncio.create_task(self._check_timeouts(db))
 
@@ -205,8 +215,8 @@ class PriceTracker:
         trades = result.scalars().all()
 
         for trade in trades:
-            # No eager loading needed - we use db.merge() in _process_tick()
-            # which re-attaches the object to the session
+            # Kept detached: ticks mutate it in memory and _flush_trade_updates
+            # writes the changed columns (no per-tick merge/SELECT)
             db.expunge(trade)
 
             self.active_trades[trade.id] = trade
@@ -217,8 +227,19 @@ class PriceTracker:
                 self.subscriptions[ws_symbol] = set()
             self.subscriptions[ws_symbol].add(trade.id)
 
+        for ws_symbol in self.subscriptions:
+            self._refresh_snapshot(ws_symbol)
+
         logger.info(f"📊 Loaded {len(trades)} active trades across {len(self.subscriptions)} symbols")
 
+    def _refresh_snapshot(self, ws_symbol: str):
+        """Rebuild the tuple _process_tick iterates (call after changing subscriptions[ws_symbol])"""
+        trade_ids = self.subscriptions.get(ws_symbol)
+        if trade_ids is None:
+            self.subscriptions_snapshot.pop(ws_symbol, None)
+        else:
+            self.subscriptions_snapshot[ws_symbol] = tuple(trade_ids)
+
     # NOTE: _watch_symbol() removed - WebSocketManager handles this with multiplexing
 
     async def _process_tick(self, symbol: str, price: float, timestamp: datetime, db: AsyncSession):
@@ -231,21 +252,28 @@ class PriceTracker:
         4. Check if TP1/TP2/TP3/SL hit
         5. Store price sample (temporary, deleted after trade closes)
         """
-        if symbol not in self.subscriptions:
+        # Immutable snapshot - safe to iterate while trades are added/removed (no per-tick copy)
+        trade_ids = self.subscriptions_snapshot.get(symbol)
+        if trade_ids is None:
             return
 
-        trade_ids = list(self.subscriptions[symbol])
         logger.debug(f"📊 Processing tick for {symbol}: ${price} (trades: {len(trade_ids)})")
 
+        # Same price for every trade on the symbol - convert to Decimal once per tick
+        price_dec = Decimal(str(price)) if price is not None else None
+        now = datetime.now(timezone.utc)
+
+        # Baseline trades on this symbol are updated with this price at the next group commit
+        if price is not None:
+            self.latest_prices[symbol] = (price, timestamp)
+
         for trade_id in trade_ids:
             trade = self.active_trades.get(trade_id)
             if not trade:
                 continue
 
-            # Merge trade into current session to avoid DetachedInstanceError
-            # This re-attaches the detached object to the active session
-            trade = await db.merge(trade)
-            self.active_trades[trade_id] = trade  # Update reference
+            # Trades stay detached and are mutated in memory; SQLAlchemy still
+            # records attribute history, which _flush_trade_updates writes in bulk
 
             # Check if entry_price or current_price is None
             if trade.entry_price is None or price is None:
@@ -259,12 +287,15 @@ class PriceTracker:
                 direction=trade.direction
             )
 
+            # One Decimal per trade, shared by MAE/MFE and the price sample
+            pnl_dec = Decimal(str(pnl_pct))
+
             # Update MAE/MFE (percentages)
             if trade.max_drawdown_pct is None or pnl_pct < float(trade.max_drawdown_pct):
-                trade.max_drawdown_pct = Decimal(str(pnl_pct))
+                trade.max_drawdown_pct = pnl_dec
 
             if trade.max_profit_pct is None or pnl_pct > float(trade.max_profit_pct):
-                trade.max_profit_pct = Decimal(str(pnl_pct))
+                trade.max_profit_pct = pnl_dec
             
             # Update MFE (absolute price) - track highest favorable price
             if trade.max_favorable_excursion is None:
@@ -273,11 +304,11 @@ class PriceTracker:
             if trade.direction == 'LONG':
                 # For LONG, track highest price
                 if price > float(trade.max_favorable_excursion):
-                    trade.max_favorable_excursion = Decimal(str(price))
+                    trade.max_favorable_excursion = price_dec
             else:  # SHORT
                 # For SHORT, track lowest price
                 if trade.max_favorable_excursion is None or price < float(trade.max_favorable_excursion):
-                    trade.max_favorable_excursion = Decimal(str(price))
+                    trade.max_favorable_excursion = price_dec
 
             # Log only at DEBUG level to reduce CPU overhead (752 trades × 1 tick/sec = 752 logs/sec!)
             logger.debug(f"💹 Trade {trade_id} ({trade.symbol}): P&L={pnl_pct:.2f}%, Max Profit={float(trade.max_profit_pct):.2f}%")
@@ -286,13 +317,10 @@ class PriceTracker:
             await self.milestone_recorder.update_milestones(trade, pnl_pct, timestamp, db)
 
             # Check TP/SL hits (updates trade object in memory)
-            await self._check_tp_sl_hits(trade, price, pnl_pct, db)
-
-            # Store price sample (add to batch, don't commit yet)
-            await self._store_price_sample_batched(trade, price, pnl_pct)
+            await self._check_tp_sl_hits(trade, price, pnl_pct, db, now)
 
-            # Batch commit (every 1 second, not every tick)
-            await self._commit_batch_if_needed(symbol, db)
+            # Store price sample (add to batch - committed by _committer_loop)
+            await self._store_price_sample_batched(trade, price_dec, pnl_dec)
 
     def _calculate_pnl_pct(self, entry_price: float, current_price: float, direction: str) -> float:
         """Calculate PnL percentage based on direction"""
@@ -306,18 +334,38 @@ class PriceTracker:
         else:  # SHORT
             return ((entry_price - current_price) / entry_price) * 100
 
-    async def _check_tp_sl_hits(self, trade: TradeSetup, price: float, pnl_pct: float, db: AsyncSession):
+    def _get_tp_levels(self, trade: TradeSetup) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """Planned TP1/TP2/TP3 % as floats (None/0 = not set), cached per trade"""
+        levels = self.tp_levels.get(trade.id)
+        if levels is None:
+            levels = tuple(
+                float(pct) if pct else None
+                for pct in (trade.planned_tp1_pct, trade.planned_tp2_pct, trade.planned_tp3_pct)
+            )
+            self.tp_levels[trade.id] = levels
+        return levels
+
+    async def _check_tp_sl_hits(
+        self,
+        trade: TradeSetup,
+        price: float,
+        pnl_pct: float,
+        db: AsyncSession,
+        now: Optional[datetime] = None
+    ):
         """
         Check if TP1/TP2/TP3/SL levels were hit
 
         Record exact time, price, and MAE at hit
         """
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         minutes_since_entry = (now - trade.entry_timestamp).total_seconds() / 60
+        tp1_pct, tp2_pct, tp3_pct = self._get_tp_levels(trade)
 
         # Check TP1
-        if not trade.tp1_hit and trade.planned_tp1_pct:
-            if pnl_pct >= float(trade.planned_tp1_pct):
+        if not trade.tp1_hit and tp1_pct:
+            if pnl_pct >= tp1_pct:
                 trade.tp1_hit = True
                 trade.tp1_hit_at = now
                 trade.tp1_hit_price = Decimal(str(price))
@@ -326,8 +374,8 @@ class PriceTracker:
                 logger.info(f"🎯 TP1 HIT: {trade.symbol} @ {price} ({pnl_pct:.2f}%) after {trade.tp1_time_minutes}min")
 
         # Check TP2
-        if not trade.tp2_hit and trade.planned_tp2_pct:
-            if pnl_pct >= float(trade.planned_tp2_pct):
+        if not trade.tp2_hit and tp2_pct:
+            if pnl_pct >= tp2_pct:
                 trade.tp2_hit = True
                 trade.tp2_hit_at = now
                 trade.tp2_hit_price = Decimal(str(price))
@@ -336,8 +384,8 @@ class PriceTracker:
                 logger.info(f"🎯🎯 TP2 HIT: {trade.symbol} @ {price} ({pnl_pct:.2f}%) after {trade.tp2_time_minutes}min")
 
         # Check TP3
-        if not trade.tp3_hit and trade.planned_tp3_pct:
-            if pnl_pct >= float(trade.planned_tp3_pct):
+        if not trade.tp3_hit and tp3_pct:
+            if pnl_pct >= tp3_pct:
                 trade.tp3_hit = True
                 trade.tp3_hit_at = now
                 trade.tp3_hit_price = Decimal(str(price))
@@ -377,134 +425,194 @@ class PriceTracker:
         )
         db.add(sample)
 
-    async def _store_price_sample_batched(self, trade: TradeSetup, price: float, pnl_pct: float):
+    async def _store_price_sample_batched(self, trade: TradeSetup, price: Decimal, pnl_pct: Decimal):
         """
         Store price sample in batch (doesn't commit immediately)
 
-        Performance: Adds to pending list per symbol, commits every 1 second
+        Performance: Adds to the shared pending list, _committer_loop writes
+        all symbols in one transaction every COMMIT_INTERVAL_SEC.
+        Takes the Decimals _process_tick already built (no re-conversion).
         """
-        # Get symbol for this trade
-        symbol = trade.ccxt_symbol if trade.ccxt_symbol else trade.symbol
-        
-        # Initialize pending list for this symbol if needed
-        if symbol not in self.pending_samples:
-            self.pending_samples[symbol] = []
-        
-        sample = TradePriceSample(
-            trade_setup_id=trade.id,
-            timestamp=datetime.now(timezone.utc),
-            price=Decimal(str(price)),
-            pnl_pct=Decimal(str(pnl_pct)),
-            max_profit_so_far=trade.max_profit_pct,
-            max_drawdown_so_far=trade.max_drawdown_pct
-        )
-        self.pending_samples[symbol].append(sample)
+        # Plain row for a Core bulk INSERT (no ORM instance state)
+        self.pending_samples.append({
+            'trade_setup_id': trade.id,
+            'timestamp': datetime.now(timezone.utc),
+            'price': price,
+            'pnl_pct': pnl_pct,
+            'max_profit_so_far': trade.max_profit_pct,
+            'max_drawdown_so_far': trade.max_drawdown_pct
+        })
+
+    def start_committer(self):
+        """Start the group committer task (no-op if already running) - call after running=True"""
+        if not self.committer_task or self.committer_task.done():
+            self.committer_stop.clear()
+            self.committer_task = asyncio.create_task(self._committer_loop())
+
+    async def stop_committer(self):
+        """
+        Stop the group committer and wait for it to exit
+
+        Call before the final _force_commit_batch on shutdown. A sleeping
+        committer wakes and exits right away; one in the middle of a commit
+        finishes that commit first (never interrupted mid-transaction).
+        """
+        task, self.committer_task = self.committer_task, None
+        if task is None:
+            return
 
-    async def _commit_batch_if_needed(self, symbol: str, db: AsyncSession):
+        self.committer_stop.set()
+        try:
+            await task
+        except Exception as e:
+            logger.error(f"❌ Group committer exited with error: {e}", exc_info=True)
+
+    async def _committer_loop(self):
         """
-        Commit pending samples for this symbol if 1 second has passed
+        Group commit: write everything pending for ALL symbols every COMMIT_INTERVAL_SEC
 
         Performance Impact:
-        - Before: 500 commits/sec at 50 trades
-        - After: 1 commit/sec per symbol (500x reduction!)
+        - Before: 1 transaction per symbol per interval (50 symbols = 50 COMMITs / 5s)
+        - After: 1 transaction per interval, whatever the number of symbols
 
-        Thread-safe with per-symbol asyncio lock.
+        Runs as one background task, started by start_tracking(). The task owns
+        one session for its whole life - only this task ever touches it, so
+        reuse across iterations is safe (the connection goes back to the pool
+        at each commit).
         """
-        # Initialize tracking for this symbol if needed
-        if symbol not in self.last_commit_time:
-            self.last_commit_time[symbol] = time.time()
-        if symbol not in self.commit_locks:
-            self.commit_locks[symbol] = asyncio.Lock()
-        
-        current_time = time.time()
-
-        # Check if 1 second has passed for this symbol
-        if current_time - self.last_commit_time[symbol] >= self.COMMIT_INTERVAL_SEC:
-            async with self.commit_locks[symbol]:
-                # Double-check after acquiring lock
-                if current_time - self.last_commit_time[symbol] >= self.COMMIT_INTERVAL_SEC:
-                    pending = self.pending_samples.get(symbol, [])
-                    if pending:
-                        # Add all pending samples for this symbol
-                        db.add_all(pending)
-                    
-                    # ⭐ CRITICAL FIX: Re-attach trades tracking this symbol to session
-                    # Without this, trade updates (tp_hit, max_profit, etc.) are LOST
-                    # Use merge() to avoid "already attached" errors
-                    if symbol in self.subscriptions:
-                        for trade_id in self.subscriptions[symbol]:
-                            trade = self.active_trades.get(trade_id)
-                            if trade:
-                                # Merge instead of add to handle session conflicts
-                                await db.merge(trade)
-                    
-                    # Commit everything (samples + trade updates)
-                    try:
-                        await db.commit()
-
-                        sample_count = len(pending)
-                        trade_count = len(self.subscriptions.get(symbol, []))
-                        logger.debug(f"✅ [BATCH_COMMIT] {symbol}: {sample_count} samples, {trade_count} trades updated")
-                    except Exception as commit_error:
-                        logger.error(f"❌ [BATCH_COMMIT] FATAL: Failed to commit batch for {symbol}: {commit_error}", exc_info=True)
-                        await db.rollback()
-                        # Don't clear pending samples on error - will retry next interval
-                        return
-
-                    # Clear pending list for this symbol
-                    self.pending_samples[symbol] = []
-
-                    # ========== BASELINE DATABASE PRICE UPDATE (AI Andre Model) ==========
-                    # After production trades updated, update baseline trades with same price
-                    try:
-                        from app.services.baseline_manager import get_baseline_manager
-                        baseline_manager = get_baseline_manager()
-
-                        # Update all baseline trades for this symbol
-                        await baseline_manager.update_price(symbol, price, timestamp)
-                        # Note: baseline_manager handles its own DB session
-                    except Exception as baseline_error:
-                        # Log error but don't fail the main price update - baseline is optional
-                        logger.debug(f"⚠️ Baseline price update failed (non-critical): {baseline_error}")
-                    # =======================================================================
-
-                    # Update last commit time for this symbol
-                    self.last_commit_time[symbol] = current_time
+        from app.database.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as db:
+            while self.running:
+                try:
+                    await asyncio.wait_for(self.committer_stop.wait(), self.COMMIT_INTERVAL_SEC)
+                    return  # stop_committer() - the caller does the final commit
+                except asyncio.TimeoutError:
+                    pass
+
+                await self._group_commit(db)
+
+    async def _group_commit(self, db: AsyncSession):
+        """One committer iteration: commit, then update baseline prices"""
+        try:
+            await self._force_commit_batch(db)
+        except Exception as commit_error:
+            # Pending rows and trade changes are kept - retried next interval
+            logger.error(f"❌ [BATCH_COMMIT] FATAL: Group commit failed: {commit_error}", exc_info=True)
+            return
+
+        # ========== BASELINE DATABASE PRICE UPDATE (AI Andre Model) ==========
+        # After production trades updated, update baseline trades with the latest price per symbol
+        latest_prices, self.latest_prices = self.latest_prices, {}
+        try:
+            from app.services.baseline_manager import get_baseline_manager
+            baseline_manager = get_baseline_manager()
+
+            for symbol, (price, timestamp) in latest_prices.items():
+                await baseline_manager.update_price(symbol, price, timestamp)
+                # Note: baseline_manager handles its own DB session
+        except Exception as baseline_error:
+            # Log error but don't fail the main price update - baseline is optional
+            logger.debug(f"⚠️ Baseline price update failed (non-critical): {baseline_error}")
+        # =======================================================================
 
     async def _force_commit_batch(self, db: AsyncSession):
         """
-        Force commit all pending samples for ALL symbols (used during shutdown or trade close)
+        Commit all pending samples and trade updates in ONE transaction
 
-        Use this when:
+        Used by _committer_loop every interval, and directly when:
         - Trade closes (need immediate commit)
         - System shutdown (cleanup)
         - Emergency stop
+
+        Raises on commit failure, with pending samples and trade changes
+        kept for the next attempt - up to MAX_COMMIT_ATTEMPTS failures in a
+        row, then the batch is dropped (logged) so one bad row can't block
+        every later write and trade close, or grow the pending list forever.
         """
-        # Commit each symbol's pending samples
-        for symbol in list(self.pending_samples.keys()):
-            if symbol not in self.commit_locks:
-                self.commit_locks[symbol] = asyncio.Lock()
-            
-            async with self.commit_locks[symbol]:
-                pending = self.pending_samples.get(symbol, [])
+        async with self.commit_lock:
+            # Take the batch before the first await - ticks keep appending to a fresh list
+            pending, self.pending_samples = self.pending_samples, []
+
+            flushed = []
+            try:
                 if pending:
-                    db.add_all(pending)
-            
-                # ⭐ CRITICAL FIX: Re-attach trades tracking this symbol
-                if symbol in self.subscriptions:
-                    for trade_id in self.subscriptions[symbol]:
-                        trade = self.active_trades.get(trade_id)
-                        if trade:
-                            db.add(trade)
-                
+                    # Insert all pending samples (all symbols) in one statement
+                    await db.execute(insert(TradePriceSample), pending)
+
+                # Trade updates (tp_hit, max_profit, etc.) for every tracked trade,
+                # changed columns only, as bulk UPDATEs by primary key
+                await self._flush_trade_updates(list(self.active_trades), db, flushed)
+
                 await db.commit()
-                
-                sample_count = len(pending)
-                trade_count = len(self.subscriptions.get(symbol, []))
-                logger.info(f"✅ Forced batch commit for {symbol}: {sample_count} samples, {trade_count} trades updated")
-                
-                # Clear pending list for this symbol
-                self.pending_samples[symbol] = []
+            except Exception:
+                await db.rollback()
+                self.failed_commit_attempts += 1
+
+                if self.failed_commit_attempts < self.MAX_COMMIT_ATTEMPTS:
+                    # Put the batch back in front of rows added meanwhile
+                    self.pending_samples[:0] = pending
+                    self._mark_unflushed(flushed)
+                else:
+                    logger.error(
+                        f"❌ [BATCH_COMMIT] Dropping batch after {self.failed_commit_attempts} failed attempts: "
+                        f"{len(pending)} samples, trade updates for {[trade.id for trade, _ in flushed]}"
+                    )
+                    self.failed_commit_attempts = 0
+                raise
+
+            self.failed_commit_attempts = 0
+
+        logger.debug(f"✅ [BATCH_COMMIT] {len(pending)} samples, {len(flushed)} trades updated")
+
+    async def _flush_trade_updates(
+        self,
+        trade_ids,
+        db: AsyncSession,
+        flushed: List[Tuple[TradeSetup, Tuple[str, ...]]]
+    ):
+        """
+        Write in-memory changes of tracked trades as bulk UPDATEs (no commit)
+
+        Changed columns come from SQLAlchemy's attribute history on the detached
+        trades. Trades with the same set of changed columns share one
+        executemany UPDATE by primary key. Their history is cleared right away
+        and (trade, changed columns) is appended to flushed before any UPDATE
+        runs, so the caller can pass it to _mark_unflushed if an UPDATE or the
+        commit fails.
+        """
+        groups: Dict[Tuple[str, ...], List[Dict]] = {}
+
+        for trade_id in trade_ids:
+            trade = self.active_trades.get(trade_id)
+            if trade is None:
+                continue
+
+            state = inspect(trade)
+            columns = state.mapper.column_attrs
+            changed = tuple(sorted(key for key in state.committed_state if key in columns))
+            if not changed:
+                continue
+
+            row = {key: state.dict.get(key) for key in changed}
+            row['id'] = trade.id
+            groups.setdefault(changed, []).append(row)
+
+            # Written below - clear history before the next await so changes
+            # made meanwhile are tracked for the next flush
+            for key in changed:
+                set_committed_value(trade, key, state.dict.get(key))
+            flushed.append((trade, changed))
+
+        for rows in groups.values():
+            await db.execute(update(TradeSetup), rows)
+
+    @staticmethod
+    def _mark_unflushed(flushed: List[Tuple[TradeSetup, Tuple[str, ...]]]):
+        """Re-flag columns of a failed flush so the next flush writes them again"""
+        for trade, changed in flushed:
+            for key in changed:
+                flag_modified(trade, key)
 
     async def _close_trade(self, trade: TradeSetup, outcome: str, final_pnl: float, db: AsyncSession):
         """
@@ -520,6 +628,13 @@ class PriceTracker:
         # Force commit pending batch BEFORE closing (ensures all samples are saved)
         await self._force_commit_batch(db)
 
+        # Tracked trades are kept detached - attach this one so the close below
+        # is flushed, and the post-trade steps can commit through db
+        if inspect(trade).detached:
+            db.add(trade)
+        else:
+            trade = await db.merge(trade)
+
         trade.status = 'completed'
         trade.completed_at = datetime.now(timezone.utc)
         trade.final_outcome = outcome
@@ -609,11 +724,14 @@ class PriceTracker:
         # Remove from active tracking
         if trade.id in self.active_trades:
             del self.active_trades[trade.id]
-        if trade.symbol in self.subscriptions:
-            self.subscriptions[trade.symbol].discard(trade.id)
+        ws_symbol = trade.ccxt_symbol if trade.ccxt_symbol else trade.symbol
+        if ws_symbol in self.subscriptions:
+            self.subscriptions[ws_symbol].discard(trade.id)
+            self._refresh_snapshot(ws_symbol)
 
         # Clear milestone cache for this trade to prevent memory leak
         self.milestone_recorder.clear_cache(trade.id)
+        self.tp_levels.pop(trade.id, None)
 
     async def _check_timeouts(self, db: AsyncSession):
         """
@@ -679,6 +797,7 @@ class PriceTracker:
             logger.info(f"📡 Reusing existing WebSocket for {ws_symbol} (multiplexed)")
 
         self.subscriptions[ws_symbol].add(trade.id)
+        self._refresh_snapshot(ws_symbol)
         logger.info(
             f"➕ Added trade {trade.id} to tracking: {trade.symbol} → {ws_symbol} {trade.direction} "
             f"(total trades on this symbol: {len(self.subscriptions[ws_symbol])})"
@@ -703,6 +822,7 @@ class PriceTracker:
 
         # Remove from active trades
         del self.active_trades[trade_id]
+        self.tp_levels.pop(trade_id, None)
 
         # Remove from subscriptions
         if ws_symbol in self.subscriptions:
@@ -720,11 +840,16 @@ class PriceTracker:
                 del self.subscriptions[ws_symbol]
                 logger.info(f"📡 No more trades on {ws_symbol}, but keeping WebSocket open for new signals")
 
+            self._refresh_snapshot(ws_symbol)
+
     async def stop(self):
         """Stop all tracking and close WebSocket connections"""
         logger.info("🛑 Stopping price tracking...")
         self.running = False
 
+        # Committer must be done before the final commit (and before the DB goes away)
+        await self.stop_committer()
+
         # Force commit any pending batches
         if self.db:
             await self._force_commit_batch(self.db)
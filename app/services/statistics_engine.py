@@ -142,10 +142,8 @@ class StatisticsEngine:
 
     async def _get_or_create_stats(self, symbol: str, db: AsyncSession) -> AssetStatistics:
         """Get existing stats or create new record"""
-        result = await db.execute(
-            select(AssetStatistics).where(AssetStatistics.symbol == symbol)
-        )
-        stats = result.scalar_one_or_none()
+        # symbol is the primary key - served from the identity map when loaded
+        stats = await db.get(AssetStatistics, symbol)
 
         if not stats:
             stats = AssetStatistics(symbol=symbol)
@@ -660,10 +658,7 @@ class StatisticsEngine:
 
         Call this when getting learned levels for a new trade.
         """
-        result = await db.execute(
-            select(AssetStatistics).where(AssetStatistics.symbol == symbol)
-        )
-        stats = result.scalar_one_or_none()
+        stats = await db.get(AssetStatistics, symbol)
 
         if not stats:
             return None
@@ -472,6 +472,25 @@ class StrategySimulator:
 
         return simulations
 
+    @staticmethod
+    def _actual_rr(sims: List[StrategySimulation]) -> Decimal:
+        """
+        Realized RR (avg win / avg loss) over the given simulations
+
+        Stored on StrategyPerformance.actual_rr_20 for the Phase III actual RR
+        check. 0 means not verifiable (< 10 trades, or no wins or no losses).
+        """
+        pnls = [float(s.simulated_pnl_pct) for s in sims]
+        wins = [p for p in pnls if p > 0]
+        losses = [-p for p in pnls if p < 0]
+
+        if len(pnls) < 10 or not wins or not losses:
+            return Decimal('0')
+
+        actual_rr = (sum(wins) / len(wins)) / (sum(losses) / len(losses))
+        # Same 999.0 cap as risk_reward (fits the Decimal column)
+        return Decimal(str(round(min(actual_rr, 999.0), 4)))
+
     @classmethod
     async def update_strategy_performance(
         cls,
@@ -519,7 +538,9 @@ class StrategySimulator:
         For now, current approach is acceptable for Phase II/III with moderate trade volume.
         Optimize when system scales to 1000+ simulations per strategy.
         """
-        # Get last 10 simulations for this strategy
+        # Get last 20 simulations with a PnL for this strategy (metrics use the
+        # last 10, actual RR for Phase III uses all 20 - the same window as the
+        # actual_rr_20 backfill and PhaseManager's fallback query)
         result = await db.execute(
             select(StrategySimulation)
             .join(TradeSetup, StrategySimulation.trade_setup_id == TradeSetup.id)
@@ -527,12 +548,14 @@ class StrategySimulator:
                 TradeSetup.symbol == symbol,
                 TradeSetup.direction == direction,
                 TradeSetup.webhook_source == webhook_source,
-                StrategySimulation.strategy_name == strategy_name
+                StrategySimulation.strategy_name == strategy_name,
+                StrategySimulation.simulated_pnl_pct.isnot(None)
             )
             .order_by(StrategySimulation.created_at.desc())
-            .limit(10)
+            .limit(20)
         )
-        recent_sims = result.scalars().all()
+        window_sims = result.scalars().all()
+        recent_sims = window_sims[:10]
 
         if not recent_sims:
             logger.warning(f"No simulations found for {strategy_name} on {symbol} {direction}")
@@ -559,6 +582,8 @@ class StrategySimulator:
 
         total_pnl = sum(float(s.simulated_pnl_usd) for s in recent_sims)
 
+        actual_rr_20 = cls._actual_rr(window_sims)
+
         # Get current strategy parameters from most recent simulation
         latest = recent_sims[0]
 
@@ -617,6 +642,7 @@ class StrategySimulator:
             perf.current_trailing_enabled = latest.trailing_enabled
             perf.current_trailing_activation = latest.trailing_activation_pct
             perf.current_trailing_distance = latest.trailing_distance_pct
+            perf.actual_rr_20 = actual_rr_20
             perf.trades_analyzed = len(recent_sims)
         else:
             # Create new
@@ -646,6 +672,7 @@ class StrategySimulator:
                 current_trailing_enabled=latest.trailing_enabled,
                 current_trailing_activation=latest.trailing_activation_pct,
                 current_trailing_distance=latest.trailing_distance_pct,
+                actual_rr_20=actual_rr_20,
                 trades_analyzed=len(recent_sims)
             )
             db.add(perf)
@@ -0,0 +1,14 @@
+-- Covering indexes for the PhaseManager hot queries.
+-- CONCURRENTLY avoids blocking writes; run outside a transaction block.
+
+-- Baseline stats: completed trades per signal ordered by exit_timestamp DESC
+-- (served by a backward index scan), final_pnl_pct included for index-only scans.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_baseline_hotpath
+    ON baseline_trades (symbol, direction, webhook_source, status, exit_timestamp)
+    INCLUDE (final_pnl_pct);
+
+-- Actual RR verification: latest simulations per strategy, with the join key
+-- to trade_setups and the pnl included.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_strategy_sim_hotpath
+    ON strategy_simulations (strategy_name, created_at)
+    INCLUDE (trade_setup_id, simulated_pnl_pct);
@@ -0,0 +1,13 @@
+-- Indexes for the portfolio simulation query (completed trades joined to their
+-- simulations, grouped by strategy in completion order).
+-- CONCURRENTLY avoids blocking writes; run outside a transaction block.
+
+-- Completed trades by completion time; partial, so only completed rows are indexed.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_completed_at_completed
+    ON trade_setups (completed_at)
+    WHERE status = 'completed';
+
+-- Join key plus strategy, pnl included so the join is index-only.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_strategy_sim_trade_strategy
+    ON strategy_simulations (trade_setup_id, strategy_name)
+    INCLUDE (simulated_pnl_pct);
@@ -0,0 +1,37 @@
+-- Realized RR over the last 20 simulations with a PnL per strategy, read by the
+-- PhaseManager actual RR check instead of aggregating simulations each time.
+-- Maintained by StrategySimulator.update_strategy_performance; rows left NULL
+-- fall back to the aggregate query.
+
+ALTER TABLE strategy_performance ADD COLUMN IF NOT EXISTS actual_rr_20 NUMERIC(10, 4);
+
+-- Backfill (0 = not verifiable: < 10 trades, or no wins or no losses)
+WITH recent AS (
+    SELECT t.symbol, t.direction, t.webhook_source, s.strategy_name, s.simulated_pnl_pct AS pnl,
+           ROW_NUMBER() OVER (
+               PARTITION BY t.symbol, t.direction, t.webhook_source, s.strategy_name
+               ORDER BY s.created_at DESC
+           ) AS rn
+    FROM strategy_simulations s
+    JOIN trade_setups t ON t.id = s.trade_setup_id
+    WHERE s.simulated_pnl_pct IS NOT NULL
+),
+agg AS (
+    SELECT symbol, direction, webhook_source, strategy_name,
+           COUNT(*) AS trades,
+           AVG(pnl) FILTER (WHERE pnl > 0) AS avg_win,
+           AVG(-pnl) FILTER (WHERE pnl < 0) AS avg_loss
+    FROM recent
+    WHERE rn <= 20
+    GROUP BY symbol, direction, webhook_source, strategy_name
+)
+UPDATE strategy_performance sp
+SET actual_rr_20 = CASE
+        WHEN agg.trades < 10 OR agg.avg_win IS NULL OR agg.avg_loss IS NULL THEN 0
+        ELSE ROUND(LEAST(agg.avg_win / agg.avg_loss, 999.0), 4)
+    END
+FROM agg
+WHERE sp.symbol = agg.symbol
+  AND sp.direction = agg.direction
+  AND sp.webhook_source = agg.webhook_source
+  AND sp.strategy_name = agg.strategy_name;
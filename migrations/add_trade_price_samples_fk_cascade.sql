@@ -0,0 +1,12 @@
+-- Tie price samples to their trade so deleting a trade removes its samples.
+-- Orphaned samples (trade already gone) are removed first; NOT VALID + VALIDATE
+-- keeps the lock short on a large table.
+
+DELETE FROM trade_price_samples s
+WHERE NOT EXISTS (SELECT 1 FROM trade_setups t WHERE t.id = s.trade_setup_id);
+
+ALTER TABLE trade_price_samples
+    ADD CONSTRAINT trade_price_samples_trade_setup_id_fkey
+    FOREIGN KEY (trade_setup_id) REFERENCES trade_setups (id) ON DELETE CASCADE NOT VALID;
+
+ALTER TABLE trade_price_samples VALIDATE CONSTRAINT trade_price_samples_trade_setup_id_fkey;
@@ -0,0 +1,5 @@
+-- Dedicated column for exchange order IDs placed by OrderExecutor.
+-- Replaces the "[ORDER_IDS] {...}" JSON blob appended to trade_setups.notes;
+-- notes is still written during rollout for backward compatibility.
+
+ALTER TABLE trade_setups ADD COLUMN IF NOT EXISTS order_tracking JSONB;